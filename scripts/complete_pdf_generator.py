@@ -1,15 +1,30 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; charts are only rendered to PNG
+from matplotlib.figure import Figure
 import numpy as np
 from collections import Counter
 import itertools
 import re
-from textblob import TextBlob
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from datetime import datetime
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
-# PDF generation imports
+# PDF generation imports (ReportLab is installed on first run only if missing)
+try:
+    import reportlab
+except ImportError:
+    print("📦 Installing ReportLab for PDF generation...")
+    import subprocess
+    import sys
+    try:
+        subprocess.check_call([sys.executable, '-m', 'pip', 'install', 'reportlab'])
+    except (subprocess.CalledProcessError, OSError) as e:
+        raise ImportError("Please install reportlab manually: pip install reportlab") from e
+
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak, Table, TableStyle
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -17,390 +32,569 @@ from reportlab.lib.units import inch
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 import os
+import io
+
+# Report styles, built once at import rather than on every report
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=colors.darkblue
+)
+
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    spaceAfter=12,
+    spaceBefore=20,
+    textColor=colors.darkblue
+)
+
+_CHART_TITLE_STYLE = ParagraphStyle(
+    'ChartTitle',
+    parent=_STYLES['Heading3'],
+    fontSize=14,
+    spaceAfter=6,
+    spaceBefore=12,
+    alignment=TA_CENTER,
+    textColor=colors.darkgreen
+)
+
+# Non-empty, whitespace-stripped items of a comma-separated list
+_LIST_ITEM_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+# Keyword extraction patterns, compiled once (URLs and @/# handles stripped in one pass)
+_URL_HANDLE_RE = re.compile(r'http\S+|www\S+|[@#]\w+')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_STOPWORDS = frozenset({'the', 'and', 'for', 'are', 'with', 'this', 'that', 'you', 'your',
+                        'our', 'can', 'will', 'have', 'has', 'been', 'from', 'they', 'them',
+                        'job', 'jobs', 'work', 'career', 'hiring', 'vacancy', 'naukri'})
+
+# Column schema of the scraper's CSV output
+_CSV_DTYPES = {
+    'Username': 'category',
+    'Tweet': 'string',
+    'Date': 'string',
+    'Time': 'string',
+    'Mentions': 'string',
+    'Hashtags': 'string',
+    'Likes': 'int64',
+    'Retweets': 'int64',
+    'Comments': 'int64',
+    'Replies': 'int64',
+    'Views': 'int64'
+}
+
+_DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+# Upper bound on points drawn in the engagement vs views scatter plot
+_MAX_SCATTER_POINTS = 5000
+
+# Rows kept in memory for the distribution charts when streaming in chunks
+_MAX_SAMPLE_ROWS = 100_000
+_SAMPLE_COLUMNS = ['Username', 'Tweet', 'Views', 'total_engagement', 'engagement_rate', 'sentiment_score']
+
+_ENGAGEMENT_COLUMNS = ['Likes', 'Retweets', 'Replies', 'Views', 'total_engagement']
+
+_N_WORKERS = os.cpu_count() or 1
+
+# Charts are embedded ~6-7in wide, so ~120 dpi is all the page can resolve;
+# histograms and the scatter plot have no fine text and go lower still
+_CHART_DPI = 120
+_DENSE_CHART_DPI = 100
+
+def _score_chunk(texts):
+    """Score a chunk of tweets with VADER compound polarity (runs in a worker process)"""
+    analyzer = SentimentIntensityAnalyzer()
+    scores = []
+    for text in texts:
+        try:
+            scores.append(analyzer.polarity_scores(str(text))['compound'])
+        except:
+            scores.append(0)
+    return scores
+
+def _score_sentiment(tweets, executor):
+    """Score a Series of tweets, sending each distinct text to the process pool once"""
+    # Score each distinct tweet once (retweets/reposts are common) and map back
+    unique_tweets = tweets.drop_duplicates()
+    texts = unique_tweets.tolist()
+    
+    # Lexicon scoring is CPU-bound pure Python, so spread the chunks across all cores
+    chunk_size = max(1, -(-len(texts) // _N_WORKERS))
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    polarity = list(itertools.chain.from_iterable(executor.map(_score_chunk, chunks)))
+    
+    unique_scores = pd.Series(polarity, index=unique_tweets.values, dtype=float)
+    return tweets.map(unique_scores)
+
+def _label_sentiment(scores):
+    """Classify sentiment scores with vectorized thresholds (standard VADER cut-offs of +/-0.05)"""
+    scores = np.asarray(scores)
+    return np.select(
+        [scores > 0.05, scores < -0.05],
+        ['Positive', 'Negative'],
+        default='Neutral'
+    )
+
+def _extract_keywords(tweets):
+    """Return the flat Series of keywords found in a Series of tweets"""
+    # Strip URLs/handles and tokenize with vectorized string methods
+    words = (
+        tweets.astype(str)
+        .str.replace(_URL_HANDLE_RE, '', regex=True)
+        .str.lower()
+        .str.findall(_WORD_RE)
+        .explode()
+        .dropna()
+    )
+    return words[~words.isin(_STOPWORDS)]
+
+def _temporal_summary(hourly_activity, daily_activity, user_activity):
+    """Bundle activity counts with their peaks"""
+    return {
+        'hourly': hourly_activity,
+        'daily': daily_activity,
+        'users': user_activity,
+        'peak_hour': int(hourly_activity.idxmax()) if not hourly_activity.empty else 12,
+        'peak_day': str(daily_activity.idxmax()) if not daily_activity.empty else 'Monday'
+    }
 
 class TwitterJobAnalysisFullPDFReport:
-    def __init__(self, csv_file='twitter_job_analysis.csv'):
+    def __init__(self, csv_file='twitter_job_analysis.csv', chunksize=None):
         self.csv_file = csv_file
+        self.chunksize = chunksize
         self.df = None
-        self.load_and_prepare_data()
+        if chunksize:
+            self.load_in_chunks()
+        else:
+            self.load_and_prepare_data()
         
     def load_and_prepare_data(self):
         """Load and prepare the CSV data"""
         try:
-            self.df = pd.read_csv(self.csv_file)
+            # Multi-threaded pyarrow parser with an explicit schema (no dtype inference);
+            # usernames repeat heavily, so category codes speed up nunique/value_counts
+            self.df = pd.read_csv(self.csv_file, engine='pyarrow', dtype=_CSV_DTYPES)
             print(f"✅ Successfully loaded {len(self.df)} tweets from {self.csv_file}")
             
-            # Handle datetime parsing
-            try:
-                self.df['datetime'] = pd.to_datetime(self.df['Date'] + ' ' + self.df['Time'], errors='coerce')
-            except:
-                clean_time = self.df['Time'].str.replace(r'\.\d+', '', regex=True)
-                self.df['datetime'] = pd.to_datetime(self.df['Date'] + ' ' + clean_time, errors='coerce')
+            self.prepare_frame(self.df)
             
-            # Parse hashtags and mentions
-            self.df['hashtags_list'] = self.df['Hashtags'].apply(self.parse_list)
-            self.df['mentions_list'] = self.df['Mentions'].apply(self.parse_list)
+            # Cache tweet lengths for the length distribution chart
+            self._tweet_lengths = self.df['Tweet'].str.len().to_numpy()
             
-            # Ensure numeric columns
-            for col in ['Likes', 'Retweets', 'Replies', 'Views']:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce').fillna(0)
+            print(f"📊 Data prepared: {len(self.df)} tweets from {self.df['Username'].nunique()} users")
             
-            # Calculate engagement metrics
-            self.df['total_engagement'] = self.df['Likes'] + self.df['Retweets'] + self.df['Replies']
-            self.df['engagement_rate'] = np.where(
-                self.df['Views'] > 0, 
-                (self.df['total_engagement'] / self.df['Views']) * 100, 
-                0
-            )
+        except Exception as e:
+            print(f"❌ Error loading data: {e}")
+            return None
+    
+    def prepare_frame(self, df):
+        """Add the derived columns used by the analyses to a raw CSV frame"""
+        # Handle datetime parsing (ISO8601 also accepts fractional seconds)
+        df['datetime'] = pd.to_datetime(
+            df['Date'] + ' ' + df['Time'], format='ISO8601', errors='coerce', cache=True
+        )
+        
+        # Parse hashtags and mentions
+        df['hashtags_list'] = self.parse_list(df['Hashtags'])
+        df['mentions_list'] = self.parse_list(df['Mentions'])
+        
+        # Calculate engagement metrics
+        df['total_engagement'] = df['Likes'] + df['Retweets'] + df['Replies']
+        # Divide only where Views > 0; zero-view rows keep a rate of 0
+        engagement = df['total_engagement'].to_numpy(dtype=np.float64)
+        views = df['Views'].to_numpy(dtype=np.float64)
+        rate = np.zeros_like(engagement)
+        np.divide(engagement, views, out=rate, where=views > 0)
+        rate *= 100
+        df['engagement_rate'] = rate
+        
+        # Add time features
+        df['hour'] = df['datetime'].dt.hour
+        df['day_of_week'] = pd.Categorical(
+            df['datetime'].dt.day_name(), categories=_DAY_ORDER, ordered=True
+        )
+        
+        return df
+    
+    def load_in_chunks(self):
+        """Stream the CSV in chunks for inputs too large to load at once.
+        
+        Counts and sums are accumulated across chunks and stored in place of the
+        cached analyses. self.df only holds a uniform random sample of at most
+        _MAX_SAMPLE_ROWS rows, which feeds the distribution charts.
+        """
+        try:
+            n_tweets = 0
+            sums = dict.fromkeys(_ENGAGEMENT_COLUMNS, 0)
+            max_engagement = 0
+            sentiment_sum = 0.0
+            label_counts, hashtag_counts, keyword_counts = Counter(), Counter(), Counter()
+            hourly_counts, daily_counts, user_counts = Counter(), Counter(), Counter()
+            first_date = last_date = None
+            top_tweets = None
+            sample = None
+            rng = np.random.default_rng(0)
             
-            # Add time features
-            self.df['hour'] = self.df['datetime'].dt.hour
-            self.df['day_of_week'] = self.df['datetime'].dt.day_name()
+            # The pyarrow engine cannot stream, so chunks come from the C parser
+            reader = pd.read_csv(self.csv_file, dtype=_CSV_DTYPES, chunksize=self.chunksize)
+            with ProcessPoolExecutor(max_workers=_N_WORKERS) as executor:
+                for chunk in reader:
+                    chunk = self.prepare_frame(chunk)
+                    chunk['sentiment_score'] = _score_sentiment(chunk['Tweet'], executor)
+                    n_tweets += len(chunk)
+                    
+                    # Running sums/maxima; means are finalized from the exact integer sums
+                    for col in _ENGAGEMENT_COLUMNS:
+                        sums[col] += int(chunk[col].sum())
+                    max_engagement = max(max_engagement, int(chunk['total_engagement'].max()))
+                    sentiment_sum += float(chunk['sentiment_score'].sum())
+                    
+                    # Running frequency counts
+                    label_counts.update(pd.Series(_label_sentiment(chunk['sentiment_score'])).value_counts().to_dict())
+                    hashtag_counts.update(chunk['hashtags_list'].explode().dropna().value_counts().to_dict())
+                    keyword_counts.update(_extract_keywords(chunk['Tweet']).value_counts().to_dict())
+                    hourly_counts.update(chunk.groupby('hour').size().to_dict())
+                    daily_counts.update(chunk.groupby('day_of_week', observed=True).size().to_dict())
+                    user_counts.update(chunk['Username'].value_counts().to_dict())
+                    
+                    dates = chunk['Date'].dropna()
+                    if not dates.empty:
+                        first_date = min(first_date or dates.min(), dates.min())
+                        last_date = max(last_date or dates.max(), dates.max())
+                    
+                    # Keep the overall top 5 by merging each chunk's top 5
+                    candidates = chunk.nlargest(5, 'total_engagement')[['Username', 'Tweet', 'total_engagement']]
+                    top_tweets = candidates if top_tweets is None else (
+                        pd.concat([top_tweets, candidates]).nlargest(5, 'total_engagement')
+                    )
+                    
+                    # Bottom-k on random keys keeps a uniform sample without replacement
+                    chunk_sample = chunk[_SAMPLE_COLUMNS].assign(_key=rng.random(len(chunk)))
+                    sample = chunk_sample if sample is None else pd.concat([sample, chunk_sample])
+                    sample = sample.nsmallest(_MAX_SAMPLE_ROWS, '_key')
             
-            print(f"📊 Data prepared: {len(self.df)} tweets from {self.df['Username'].nunique()} users")
+            print(f"✅ Successfully streamed {n_tweets} tweets from {self.csv_file}")
+            
+            self.df = sample.drop(columns='_key').sort_index()
+            self._tweet_lengths = self.df['Tweet'].str.len().to_numpy()
+            
+            # Store the finalized aggregates in place of the cached analyses
+            n = max(n_tweets, 1)
+            unique_users = sum(1 for count in user_counts.values() if count)
+            self.sentiment_dist = pd.Series(dict(label_counts.most_common()), name='count')
+            self.hashtag_counts = hashtag_counts.most_common(15)
+            self.keyword_counts = keyword_counts.most_common(20)
+            self.engagement_stats = {
+                'total_tweets': n_tweets,
+                'unique_users': unique_users,
+                'total_likes': sums['Likes'],
+                'total_retweets': sums['Retweets'],
+                'total_replies': sums['Replies'],
+                'total_views': sums['Views'],
+                'avg_likes': sums['Likes'] / n,
+                'avg_retweets': sums['Retweets'] / n,
+                'avg_replies': sums['Replies'] / n,
+                'avg_views': sums['Views'] / n,
+                'avg_engagement': sums['total_engagement'] / n,
+                'max_engagement': max_engagement
+            }
+            self.temporal_data = _temporal_summary(
+                pd.Series(hourly_counts, dtype='int64').sort_index(),
+                pd.Series(daily_counts, dtype='int64').reindex(_DAY_ORDER, fill_value=0),
+                pd.Series(dict(user_counts.most_common(10)), dtype='int64')
+            )
+            self.top_tweets = top_tweets
+            self.dataset_summary = {
+                'first_date': first_date,
+                'last_date': last_date,
+                'avg_sentiment': sentiment_sum / n,
+                'unique_hashtags': len(hashtag_counts),
+                'avg_hashtags': sum(hashtag_counts.values()) / n
+            }
+            
+            print(f"📊 Data prepared: {n_tweets} tweets from {unique_users} users")
             
         except Exception as e:
             print(f"❌ Error loading data: {e}")
+            self.df = None
             return None
     
-    def parse_list(self, text):
-        """Parse comma-separated string to list"""
-        if pd.isna(text) or text == '' or str(text).lower() == 'nan':
-            return []
-        return [item.strip() for item in str(text).split(',') if item.strip()]
+    def parse_list(self, column):
+        """Parse a column of comma-separated strings to lists"""
+        return column.fillna('').astype(str).str.findall(_LIST_ITEM_RE)
     
-    def perform_sentiment_analysis(self):
+    @cached_property
+    def sentiment_dist(self):
         """Perform sentiment analysis on tweets"""
-        def get_sentiment(text):
-            try:
-                return TextBlob(str(text)).sentiment.polarity
-            except:
-                return 0
-        
-        def classify_sentiment(score):
-            if score > 0.1:
-                return 'Positive'
-            elif score < -0.1:
-                return 'Negative'
-            else:
-                return 'Neutral'
-        
-        self.df['sentiment_score'] = self.df['Tweet'].apply(get_sentiment)
-        self.df['sentiment_label'] = self.df['sentiment_score'].apply(classify_sentiment)
+        with ProcessPoolExecutor(max_workers=_N_WORKERS) as executor:
+            self.df['sentiment_score'] = _score_sentiment(self.df['Tweet'], executor)
+        self.df['sentiment_label'] = _label_sentiment(self.df['sentiment_score'])
         
         return self.df['sentiment_label'].value_counts()
     
-    def analyze_hashtags(self):
+    @cached_property
+    def hashtag_counts(self):
         """Analyze hashtag usage"""
-        all_hashtags = list(itertools.chain(*self.df['hashtags_list']))
-        return Counter(all_hashtags).most_common(15)
+        hashtag_counts = self.df['hashtags_list'].explode().dropna().value_counts()
+        
+        # Record summary figures from the same counts for the report
+        self._unique_hashtag_count = len(hashtag_counts)
+        self._avg_hashtags_per_tweet = int(hashtag_counts.sum()) / len(self.df)
+        
+        return [(tag, int(count)) for tag, count in hashtag_counts.head(15).items()]
     
-    def analyze_keywords(self):
+    @cached_property
+    def keyword_counts(self):
         """Extract and analyze keywords"""
-        def extract_keywords(text):
-            text = re.sub(r'http\S+|www\S+|https\S+', '', str(text), flags=re.MULTILINE)
-            text = re.sub(r'@\w+|#\w+', '', text)
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-            stopwords = {'the', 'and', 'for', 'are', 'with', 'this', 'that', 'you', 'your', 
-                        'our', 'can', 'will', 'have', 'has', 'been', 'from', 'they', 'them',
-                        'job', 'jobs', 'work', 'career', 'hiring', 'vacancy', 'naukri'}
-            return [word for word in words if word not in stopwords and len(word) > 2]
-        
-        all_words = list(itertools.chain(*self.df['Tweet'].apply(extract_keywords)))
-        return Counter(all_words).most_common(20)
+        keyword_counts = _extract_keywords(self.df['Tweet']).value_counts().head(20)
+        return [(word, int(count)) for word, count in keyword_counts.items()]
     
-    def analyze_engagement(self):
+    @cached_property
+    def engagement_stats(self):
         """Analyze engagement patterns"""
+        # One fused aggregation over the engagement columns
+        agg = self.df[_ENGAGEMENT_COLUMNS].agg(['sum', 'mean', 'max'])
         stats = {
             'total_tweets': len(self.df),
             'unique_users': self.df['Username'].nunique(),
-            'total_likes': int(self.df['Likes'].sum()),
-            'total_retweets': int(self.df['Retweets'].sum()),
-            'total_replies': int(self.df['Replies'].sum()),
-            'total_views': int(self.df['Views'].sum()),
-            'avg_likes': float(self.df['Likes'].mean()),
-            'avg_retweets': float(self.df['Retweets'].mean()),
-            'avg_replies': float(self.df['Replies'].mean()),
-            'avg_views': float(self.df['Views'].mean()),
-            'avg_engagement': float(self.df['total_engagement'].mean()),
-            'max_engagement': int(self.df['total_engagement'].max())
+            'total_likes': int(agg.loc['sum', 'Likes']),
+            'total_retweets': int(agg.loc['sum', 'Retweets']),
+            'total_replies': int(agg.loc['sum', 'Replies']),
+            'total_views': int(agg.loc['sum', 'Views']),
+            'avg_likes': float(agg.loc['mean', 'Likes']),
+            'avg_retweets': float(agg.loc['mean', 'Retweets']),
+            'avg_replies': float(agg.loc['mean', 'Replies']),
+            'avg_views': float(agg.loc['mean', 'Views']),
+            'avg_engagement': float(agg.loc['mean', 'total_engagement']),
+            'max_engagement': int(agg.loc['max', 'total_engagement'])
         }
         
         return stats
     
-    def analyze_temporal_patterns(self):
+    @cached_property
+    def temporal_data(self):
         """Analyze temporal patterns"""
-        hourly_activity = self.df['hour'].value_counts().sort_index()
-        daily_activity = self.df['day_of_week'].value_counts()
+        # groupby returns hours sorted and days in calendar order (including empty days)
+        hourly_activity = self.df.groupby('hour').size()
+        daily_activity = self.df.groupby('day_of_week', observed=False).size()
         user_activity = self.df['Username'].value_counts().head(10)
         
+        return _temporal_summary(hourly_activity, daily_activity, user_activity)
+    
+    @cached_property
+    def top_tweets(self):
+        """Find the 5 most engaging tweets"""
+        # Partial selection; keep='first' breaks ties at the cutoff by row order, like the chunked merge
+        return self.df.nlargest(5, 'total_engagement', keep='first')
+    
+    @cached_property
+    def dataset_summary(self):
+        """Summarize date range, sentiment and hashtag usage for the report text"""
+        # Both analyses must have run: they fill sentiment_score and the hashtag totals
+        self.sentiment_dist
+        self.hashtag_counts
         return {
-            'hourly': hourly_activity,
-            'daily': daily_activity,
-            'users': user_activity,
-            'peak_hour': int(hourly_activity.idxmax()) if not hourly_activity.empty else 12,
-            'peak_day': str(daily_activity.idxmax()) if not daily_activity.empty else 'Monday'
+            'first_date': self.df['Date'].min(),
+            'last_date': self.df['Date'].max(),
+            'avg_sentiment': float(self.df['sentiment_score'].mean()),
+            'unique_hashtags': self._unique_hashtag_count,
+            'avg_hashtags': self._avg_hashtags_per_tweet
         }
     
+    def render_chart(self, plot_fn, figsize, dpi=_CHART_DPI):
+        """Draw a chart on a standalone Figure and return it as an in-memory PNG"""
+        fig = Figure(figsize=figsize)
+        ax = fig.add_subplot()
+        plot_fn(ax)
+        fig.tight_layout()
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png', dpi=dpi, bbox_inches='tight')
+        buf.seek(0)
+        return buf
+    
     def create_all_12_charts(self):
         """Create all 12 individual charts for PDF inclusion"""
         print("📊 Creating all 12 charts for PDF inclusion...")
         
-        # Perform all analyses
-        sentiment_dist = self.perform_sentiment_analysis()
-        hashtag_counts = self.analyze_hashtags()
-        keyword_counts = self.analyze_keywords()
-        engagement_stats = self.analyze_engagement()
-        temporal_data = self.analyze_temporal_patterns()
-        
-        chart_files = []
-        chart_titles = []
+        # Perform all analyses (each is computed once and cached on the instance)
+        sentiment_dist = self.sentiment_dist
+        hashtag_counts = self.hashtag_counts
+        keyword_counts = self.keyword_counts
+        engagement_stats = self.engagement_stats
+        temporal_data = self.temporal_data
         
         # 1. Sentiment Distribution Pie Chart
-        plt.figure(figsize=(8, 6))
-        colors = ['#2E8B57', '#FF6B6B', '#4ECDC4']
-        sentiment_dist.plot.pie(autopct='%1.1f%%', startangle=90, colors=colors)
-        plt.title('Sentiment Distribution', fontsize=16, fontweight='bold')
-        plt.ylabel('')
-        plt.tight_layout()
-        chart1 = 'chart1_sentiment_distribution.png'
-        plt.savefig(chart1, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart1)
-        chart_titles.append('Sentiment Distribution')
+        def plot_sentiment_distribution(ax):
+            colors = ['#2E8B57', '#FF6B6B', '#4ECDC4']
+            sentiment_dist.plot.pie(ax=ax, autopct='%1.1f%%', startangle=90, colors=colors)
+            ax.set_title('Sentiment Distribution', fontsize=16, fontweight='bold')
+            ax.set_ylabel('')
         
         # 2. Top 10 Hashtags Bar Chart
-        plt.figure(figsize=(10, 6))
-        if hashtag_counts:
-            tags, counts = zip(*hashtag_counts[:10])
-            plt.barh(range(len(tags)), counts, color='skyblue')
-            plt.yticks(range(len(tags)), tags)
-            plt.title('Top 10 Hashtags', fontsize=16, fontweight='bold')
-            plt.xlabel('Count')
-            plt.grid(axis='x', alpha=0.3)
-        plt.tight_layout()
-        chart2 = 'chart2_top_hashtags.png'
-        plt.savefig(chart2, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart2)
-        chart_titles.append('Top 10 Hashtags')
+        def plot_top_hashtags(ax):
+            if hashtag_counts:
+                tags, counts = zip(*hashtag_counts[:10])
+                ax.barh(range(len(tags)), counts, color='skyblue')
+                ax.set_yticks(range(len(tags)), labels=tags)
+                ax.set_title('Top 10 Hashtags', fontsize=16, fontweight='bold')
+                ax.set_xlabel('Count')
+                ax.grid(axis='x', alpha=0.3)
         
         # 3. Top 10 Keywords Bar Chart
-        plt.figure(figsize=(10, 6))
-        if keyword_counts:
-            words, counts = zip(*keyword_counts[:10])
-            plt.barh(range(len(words)), counts, color='lightcoral')
-            plt.yticks(range(len(words)), words)
-            plt.title('Top 10 Keywords', fontsize=16, fontweight='bold')
-            plt.xlabel('Count')
-            plt.grid(axis='x', alpha=0.3)
-        plt.tight_layout()
-        chart3 = 'chart3_top_keywords.png'
-        plt.savefig(chart3, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart3)
-        chart_titles.append('Top 10 Keywords')
+        def plot_top_keywords(ax):
+            if keyword_counts:
+                words, counts = zip(*keyword_counts[:10])
+                ax.barh(range(len(words)), counts, color='lightcoral')
+                ax.set_yticks(range(len(words)), labels=words)
+                ax.set_title('Top 10 Keywords', fontsize=16, fontweight='bold')
+                ax.set_xlabel('Count')
+                ax.grid(axis='x', alpha=0.3)
         
         # 4. Average Engagement Metrics Bar Chart
-        plt.figure(figsize=(8, 6))
-        metrics = ['Likes', 'Retweets', 'Replies', 'Views']
-        values = [engagement_stats['avg_likes'], engagement_stats['avg_retweets'], 
-                 engagement_stats['avg_replies'], engagement_stats['avg_views']]
-        bars = plt.bar(metrics, values, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A'])
-        plt.title('Average Engagement Metrics', fontsize=16, fontweight='bold')
-        plt.ylabel('Average Count')
-        
-        # Add value labels on bars
-        for bar, value in zip(bars, values):
-            plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(values)*0.01, 
-                    f'{value:.1f}', ha='center', va='bottom')
-        plt.tight_layout()
-        chart4 = 'chart4_engagement_metrics.png'
-        plt.savefig(chart4, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart4)
-        chart_titles.append('Average Engagement Metrics')
+        def plot_engagement_metrics(ax):
+            metrics = ['Likes', 'Retweets', 'Replies', 'Views']
+            values = [engagement_stats['avg_likes'], engagement_stats['avg_retweets'], 
+                     engagement_stats['avg_replies'], engagement_stats['avg_views']]
+            bars = ax.bar(metrics, values, color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A'])
+            ax.set_title('Average Engagement Metrics', fontsize=16, fontweight='bold')
+            ax.set_ylabel('Average Count')
+            
+            # Add value labels on bars
+            for bar, value in zip(bars, values):
+                ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + max(values)*0.01, 
+                        f'{value:.1f}', ha='center', va='bottom')
         
         # 5. Hourly Activity Line Chart
-        plt.figure(figsize=(10, 6))
-        temporal_data['hourly'].plot(kind='line', marker='o', linewidth=2, color='#2E8B57')
-        plt.title('Tweet Activity by Hour', fontsize=16, fontweight='bold')
-        plt.xlabel('Hour of Day')
-        plt.ylabel('Tweet Count')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        chart5 = 'chart5_hourly_activity.png'
-        plt.savefig(chart5, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart5)
-        chart_titles.append('Tweet Activity by Hour')
+        def plot_hourly_activity(ax):
+            temporal_data['hourly'].plot(ax=ax, kind='line', marker='o', linewidth=2, color='#2E8B57')
+            ax.set_title('Tweet Activity by Hour', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Hour of Day')
+            ax.set_ylabel('Tweet Count')
+            ax.grid(True, alpha=0.3)
         
         # 6. Daily Activity Bar Chart
-        plt.figure(figsize=(8, 6))
-        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        daily_reordered = temporal_data['daily'].reindex(day_order, fill_value=0)
-        bars = plt.bar(range(len(daily_reordered)), daily_reordered.values, color='lightgreen')
-        plt.xticks(range(len(daily_reordered)), [day[:3] for day in daily_reordered.index])
-        plt.title('Tweet Activity by Day of Week', fontsize=16, fontweight='bold')
-        plt.ylabel('Tweet Count')
-        
-        # Add value labels on bars
-        for bar, value in zip(bars, daily_reordered.values):
-            if value > 0:
-                plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, 
-                        f'{value}', ha='center', va='bottom')
-        plt.tight_layout()
-        chart6 = 'chart6_daily_activity.png'
-        plt.savefig(chart6, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart6)
-        chart_titles.append('Tweet Activity by Day of Week')
+        def plot_daily_activity(ax):
+            daily = temporal_data['daily']
+            bars = ax.bar(range(len(daily)), daily.values, color='lightgreen')
+            ax.set_xticks(range(len(daily)), labels=[day[:3] for day in daily.index])
+            ax.set_title('Tweet Activity by Day of Week', fontsize=16, fontweight='bold')
+            ax.set_ylabel('Tweet Count')
+            
+            # Add value labels on bars
+            for bar, value in zip(bars, daily.values):
+                if value > 0:
+                    ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 0.5, 
+                            f'{value}', ha='center', va='bottom')
         
         # 7. Top 10 Most Active Users
-        plt.figure(figsize=(10, 6))
-        plt.barh(range(len(temporal_data['users'])), temporal_data['users'].values, color='purple')
-        plt.yticks(range(len(temporal_data['users'])), 
-                  [f"{user[:12]}..." if len(user) > 12 else user for user in temporal_data['users'].index])
-        plt.title('Top 10 Most Active Users', fontsize=16, fontweight='bold')
-        plt.xlabel('Tweet Count')
-        plt.grid(axis='x', alpha=0.3)
-        plt.tight_layout()
-        chart7 = 'chart7_active_users.png'
-        plt.savefig(chart7, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart7)
-        chart_titles.append('Top 10 Most Active Users')
+        def plot_active_users(ax):
+            ax.barh(range(len(temporal_data['users'])), temporal_data['users'].values, color='purple')
+            ax.set_yticks(range(len(temporal_data['users'])), 
+                          labels=[f"{user[:12]}..." if len(user) > 12 else user for user in temporal_data['users'].index])
+            ax.set_title('Top 10 Most Active Users', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Tweet Count')
+            ax.grid(axis='x', alpha=0.3)
         
         # 8. Engagement Rate Distribution
-        plt.figure(figsize=(8, 6))
-        plt.hist(self.df['engagement_rate'], bins=20, alpha=0.7, color='orange', edgecolor='black')
-        plt.title('Engagement Rate Distribution', fontsize=16, fontweight='bold')
-        plt.xlabel('Engagement Rate (%)')
-        plt.ylabel('Frequency')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        chart8 = 'chart8_engagement_rate_dist.png'
-        plt.savefig(chart8, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart8)
-        chart_titles.append('Engagement Rate Distribution')
+        def plot_engagement_rate_dist(ax):
+            ax.hist(self.df['engagement_rate'], bins=20, alpha=0.7, color='orange', edgecolor='black')
+            ax.set_title('Engagement Rate Distribution', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Engagement Rate (%)')
+            ax.set_ylabel('Frequency')
+            ax.grid(True, alpha=0.3)
         
         # 9. Sentiment Score Distribution
-        plt.figure(figsize=(8, 6))
-        plt.hist(self.df['sentiment_score'], bins=20, alpha=0.7, color='cyan', edgecolor='black')
-        plt.title('Sentiment Score Distribution', fontsize=16, fontweight='bold')
-        plt.xlabel('Sentiment Score')
-        plt.ylabel('Frequency')
-        plt.axvline(x=0, color='red', linestyle='--', alpha=0.7, label='Neutral')
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        chart9 = 'chart9_sentiment_score_dist.png'
-        plt.savefig(chart9, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart9)
-        chart_titles.append('Sentiment Score Distribution')
+        def plot_sentiment_score_dist(ax):
+            ax.hist(self.df['sentiment_score'], bins=20, alpha=0.7, color='cyan', edgecolor='black')
+            ax.set_title('Sentiment Score Distribution', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Sentiment Score')
+            ax.set_ylabel('Frequency')
+            ax.axvline(x=0, color='red', linestyle='--', alpha=0.7, label='Neutral')
+            ax.legend()
+            ax.grid(True, alpha=0.3)
         
         # 10. Tweet Length Distribution
-        plt.figure(figsize=(8, 6))
-        tweet_lengths = self.df['Tweet'].str.len()
-        plt.hist(tweet_lengths, bins=20, alpha=0.7, color='gold', edgecolor='black')
-        plt.title('Tweet Length Distribution', fontsize=16, fontweight='bold')
-        plt.xlabel('Tweet Length (characters)')
-        plt.ylabel('Frequency')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        chart10 = 'chart10_tweet_length_dist.png'
-        plt.savefig(chart10, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart10)
-        chart_titles.append('Tweet Length Distribution')
+        def plot_tweet_length_dist(ax):
+            ax.hist(self._tweet_lengths, bins=20, alpha=0.7, color='gold', edgecolor='black')
+            ax.set_title('Tweet Length Distribution', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Tweet Length (characters)')
+            ax.set_ylabel('Frequency')
+            ax.grid(True, alpha=0.3)
         
         # 11. Engagement vs Views Scatter Plot
-        plt.figure(figsize=(8, 6))
-        plt.scatter(self.df['Views'], self.df['total_engagement'], alpha=0.6, color='navy')
-        plt.xlabel('Views')
-        plt.ylabel('Total Engagement')
-        plt.title('Engagement vs Views Correlation', fontsize=16, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        chart11 = 'chart11_engagement_vs_views.png'
-        plt.savefig(chart11, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart11)
-        chart_titles.append('Engagement vs Views Correlation')
+        def plot_engagement_vs_views(ax):
+            # Large datasets are down-sampled; a fixed seed keeps the chart reproducible
+            points = self.df[['Views', 'total_engagement']]
+            if len(points) > _MAX_SCATTER_POINTS:
+                points = points.sample(_MAX_SCATTER_POINTS, random_state=0)
+            ax.scatter(points['Views'], points['total_engagement'], alpha=0.6, color='navy')
+            ax.set_xlabel('Views')
+            ax.set_ylabel('Total Engagement')
+            ax.set_title('Engagement vs Views Correlation', fontsize=16, fontweight='bold')
+            ax.grid(True, alpha=0.3)
         
         # 12. Top 5 Most Engaging Tweets
-        plt.figure(figsize=(10, 6))
-        top_5_tweets = self.df.nlargest(5, 'total_engagement')
-        plt.barh(range(len(top_5_tweets)), top_5_tweets['total_engagement'], color='gold')
-        plt.yticks(range(len(top_5_tweets)), 
-                  [f"@{user[:10]}..." for user in top_5_tweets['Username']])
-        plt.title('Top 5 Most Engaging Tweets', fontsize=16, fontweight='bold')
-        plt.xlabel('Total Engagement')
-        plt.grid(axis='x', alpha=0.3)
-        plt.tight_layout()
-        chart12 = 'chart12_top_engaging_tweets.png'
-        plt.savefig(chart12, dpi=300, bbox_inches='tight')
-        plt.close()
-        chart_files.append(chart12)
-        chart_titles.append('Top 5 Most Engaging Tweets')
-        
-        return chart_files, chart_titles, sentiment_dist, hashtag_counts, keyword_counts, engagement_stats, temporal_data
+        def plot_top_engaging_tweets(ax):
+            top_5_tweets = self.top_tweets
+            ax.barh(range(len(top_5_tweets)), top_5_tweets['total_engagement'], color='gold')
+            ax.set_yticks(range(len(top_5_tweets)), 
+                          labels=[f"@{user[:10]}..." for user in top_5_tweets['Username']])
+            ax.set_title('Top 5 Most Engaging Tweets', fontsize=16, fontweight='bold')
+            ax.set_xlabel('Total Engagement')
+            ax.grid(axis='x', alpha=0.3)
+        
+        charts = [
+            ('Sentiment Distribution', (8, 6), _CHART_DPI, plot_sentiment_distribution),
+            ('Top 10 Hashtags', (10, 6), _CHART_DPI, plot_top_hashtags),
+            ('Top 10 Keywords', (10, 6), _CHART_DPI, plot_top_keywords),
+            ('Average Engagement Metrics', (8, 6), _CHART_DPI, plot_engagement_metrics),
+            ('Tweet Activity by Hour', (10, 6), _CHART_DPI, plot_hourly_activity),
+            ('Tweet Activity by Day of Week', (8, 6), _CHART_DPI, plot_daily_activity),
+            ('Top 10 Most Active Users', (10, 6), _CHART_DPI, plot_active_users),
+            ('Engagement Rate Distribution', (8, 6), _DENSE_CHART_DPI, plot_engagement_rate_dist),
+            ('Sentiment Score Distribution', (8, 6), _DENSE_CHART_DPI, plot_sentiment_score_dist),
+            ('Tweet Length Distribution', (8, 6), _DENSE_CHART_DPI, plot_tweet_length_dist),
+            ('Engagement vs Views Correlation', (8, 6), _DENSE_CHART_DPI, plot_engagement_vs_views),
+            ('Top 5 Most Engaging Tweets', (10, 6), _CHART_DPI, plot_top_engaging_tweets)
+        ]
+        
+        # Each chart gets its own Figure, so they can be rendered concurrently
+        chart_titles, figsizes, dpis, plot_fns = (list(column) for column in zip(*charts))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            chart_images = list(executor.map(self.render_chart, plot_fns, figsizes, dpis))
+        
+        return chart_images, chart_titles, sentiment_dist, hashtag_counts, keyword_counts, engagement_stats, temporal_data
     
     def generate_full_pdf_report(self):
         """Generate comprehensive PDF report with all 12 embedded charts"""
         print("📄 Generating comprehensive PDF report with all 12 visualizations...")
         
         # Create all charts and get analysis data
-        chart_files, chart_titles, sentiment_dist, hashtag_counts, keyword_counts, engagement_stats, temporal_data = self.create_all_12_charts()
+        chart_images, chart_titles, sentiment_dist, hashtag_counts, keyword_counts, engagement_stats, temporal_data = self.create_all_12_charts()
+        summary = self.dataset_summary
         
         # Create PDF document
         pdf_filename = 'Twitter_Job_Analysis_Complete_Report.pdf'
         doc = SimpleDocTemplate(pdf_filename, pagesize=letter, topMargin=0.5*inch)
         
-        # Get styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            textColor=colors.darkblue
-        )
-        
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=16,
-            spaceAfter=12,
-            spaceBefore=20,
-            textColor=colors.darkblue
-        )
-        
-        chart_title_style = ParagraphStyle(
-            'ChartTitle',
-            parent=styles['Heading3'],
-            fontSize=14,
-            spaceAfter=6,
-            spaceBefore=12,
-            alignment=TA_CENTER,
-            textColor=colors.darkgreen
-        )
-        
         # Build PDF content
         content = []
         
         # Title Page
-        content.append(Paragraph("COMPREHENSIVE TWITTER JOB DATA ANALYSIS REPORT", title_style))
+        content.append(Paragraph("COMPREHENSIVE TWITTER JOB DATA ANALYSIS REPORT", _TITLE_STYLE))
         content.append(Spacer(1, 0.3*inch))
-        content.append(Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", styles['Normal']))
-        content.append(Paragraph(f"Data Source: {self.csv_file}", styles['Normal']))
+        content.append(Paragraph(f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", _STYLES['Normal']))
+        content.append(Paragraph(f"Data Source: {self.csv_file}", _STYLES['Normal']))
         content.append(Spacer(1, 0.5*inch))
         
         # Executive Summary
-        content.append(Paragraph("EXECUTIVE SUMMARY", heading_style))
+        content.append(Paragraph("EXECUTIVE SUMMARY", _HEADING_STYLE))
         summary_text = f"""
         This comprehensive analysis examines {engagement_stats['total_tweets']} Twitter tweets 
         related to job searches, career opportunities, and employment discussions collected 
@@ -409,12 +603,12 @@ class TwitterJobAnalysisFullPDFReport:
         <b>Key Metrics Overview:</b><br/>
         • Total Tweets Analyzed: {engagement_stats['total_tweets']}<br/>
         • Unique Users: {engagement_stats['unique_users']}<br/>
-        • Date Range: {self.df['Date'].min()} to {self.df['Date'].max()}<br/>
+        • Date Range: {summary['first_date']} to {summary['last_date']}<br/>
         • Total Engagement: {engagement_stats['total_likes'] + engagement_stats['total_retweets'] + engagement_stats['total_replies']}<br/>
         • Total Views: {engagement_stats['total_views']}<br/>
         • Average Engagement per Tweet: {engagement_stats['avg_engagement']:.2f}
         """
-        content.append(Paragraph(summary_text, styles['Normal']))
+        content.append(Paragraph(summary_text, _STYLES['Normal']))
         content.append(PageBreak())
         
         # Add all 12 charts with descriptions
@@ -433,74 +627,72 @@ class TwitterJobAnalysisFullPDFReport:
             f"The highest-performing tweets by total engagement, showcasing content that resonates most with the audience."
         ]
         
-        for i, (chart_file, chart_title, description) in enumerate(zip(chart_files, chart_titles, chart_descriptions), 1):
-            content.append(Paragraph(f"Chart {i}: {chart_title}", chart_title_style))
+        for i, (chart_image, chart_title, description) in enumerate(zip(chart_images, chart_titles, chart_descriptions), 1):
+            content.append(Paragraph(f"Chart {i}: {chart_title}", _CHART_TITLE_STYLE))
             
-            if os.path.exists(chart_file):
-                # Adjust image size based on chart type
-                if i in [2, 3, 7]:  # Horizontal bar charts need more width
-                    img = Image(chart_file, width=7*inch, height=4.2*inch)
-                else:
-                    img = Image(chart_file, width=6*inch, height=4.5*inch)
-                content.append(img)
+            # Adjust image size based on chart type
+            if i in [2, 3, 7]:  # Horizontal bar charts need more width
+                img = Image(chart_image, width=7*inch, height=4.2*inch)
+            else:
+                img = Image(chart_image, width=6*inch, height=4.5*inch)
+            content.append(img)
             
             content.append(Spacer(1, 0.1*inch))
-            content.append(Paragraph(description, styles['Normal']))
+            content.append(Paragraph(description, _STYLES['Normal']))
             content.append(Spacer(1, 0.2*inch))
             
             # Add page break after every 2 charts except the last one
-            if i % 2 == 0 and i < len(chart_files):
+            if i % 2 == 0 and i < len(chart_images):
                 content.append(PageBreak())
         
         # Analysis Summary Page
         content.append(PageBreak())
-        content.append(Paragraph("DETAILED ANALYSIS SUMMARY", heading_style))
+        content.append(Paragraph("DETAILED ANALYSIS SUMMARY", _HEADING_STYLE))
         
         # Sentiment Analysis Summary
-        content.append(Paragraph("Sentiment Analysis", chart_title_style))
+        content.append(Paragraph("Sentiment Analysis", _CHART_TITLE_STYLE))
         sentiment_text = f"""
         <b>Sentiment Distribution:</b><br/>
         """
         for sentiment, count in sentiment_dist.items():
-            percentage = (count / len(self.df)) * 100
+            percentage = (count / engagement_stats['total_tweets']) * 100
             sentiment_text += f"• {sentiment}: {count} tweets ({percentage:.1f}%)<br/>"
         
         sentiment_text += f"""<br/>
-        <b>Average Sentiment Score:</b> {self.df['sentiment_score'].mean():.3f}<br/>
+        <b>Average Sentiment Score:</b> {summary['avg_sentiment']:.3f}<br/>
         The overall sentiment is {sentiment_dist.idxmax().lower()}, indicating a {sentiment_dist.idxmax().lower()} tone in job-related discussions.
         """
-        content.append(Paragraph(sentiment_text, styles['Normal']))
+        content.append(Paragraph(sentiment_text, _STYLES['Normal']))
         content.append(Spacer(1, 0.2*inch))
         
         # Hashtag Analysis Summary
-        content.append(Paragraph("Hashtag Analysis", chart_title_style))
+        content.append(Paragraph("Hashtag Analysis", _CHART_TITLE_STYLE))
         hashtag_text = f"""
         <b>Top 5 Hashtags:</b><br/>
         """
         for i, (hashtag, count) in enumerate(hashtag_counts[:5], 1):
             hashtag_text += f"{i}. {hashtag}: {count} occurrences<br/>"
         
-        total_hashtags = len(set(itertools.chain(*self.df['hashtags_list'])))
         hashtag_text += f"""<br/>
-        <b>Total Unique Hashtags:</b> {total_hashtags}<br/>
-        <b>Average Hashtags per Tweet:</b> {self.df['hashtags_list'].apply(len).mean():.2f}
+        <b>Total Unique Hashtags:</b> {summary['unique_hashtags']}<br/>
+        <b>Average Hashtags per Tweet:</b> {summary['avg_hashtags']:.2f}
         """
-        content.append(Paragraph(hashtag_text, styles['Normal']))
+        content.append(Paragraph(hashtag_text, _STYLES['Normal']))
         content.append(Spacer(1, 0.2*inch))
         
         # Engagement Summary
-        content.append(Paragraph("Engagement Summary", chart_title_style))
+        content.append(Paragraph("Engagement Summary", _CHART_TITLE_STYLE))
         engagement_text = f"""
         <b>Total Engagement:</b> {engagement_stats['total_likes'] + engagement_stats['total_retweets'] + engagement_stats['total_replies']}<br/>
         <b>Average Engagement per Tweet:</b> {engagement_stats['avg_engagement']:.2f}<br/>
         <b>Highest Engagement:</b> {engagement_stats['max_engagement']} interactions<br/>
         <b>Peak Activity:</b> {temporal_data['peak_hour']}:00 on {temporal_data['peak_day']}s
         """
-        content.append(Paragraph(engagement_text, styles['Normal']))
+        content.append(Paragraph(engagement_text, _STYLES['Normal']))
         
         # Recommendations Section
         content.append(PageBreak())
-        content.append(Paragraph("ACTIONABLE RECOMMENDATIONS", heading_style))
+        content.append(Paragraph("ACTIONABLE RECOMMENDATIONS", _HEADING_STYLE))
         
         recommendations_text = f"""
         <b>1. Optimal Posting Strategy:</b><br/>
@@ -517,11 +709,11 @@ class TwitterJobAnalysisFullPDFReport:
         • Monitor sentiment trends for market insights<br/>
         • Maintain consistent posting during peak hours
         """
-        content.append(Paragraph(recommendations_text, styles['Normal']))
+        content.append(Paragraph(recommendations_text, _STYLES['Normal']))
         
         # Conclusion
         content.append(Spacer(1, 0.3*inch))
-        content.append(Paragraph("CONCLUSION", heading_style))
+        content.append(Paragraph("CONCLUSION", _HEADING_STYLE))
         
         conclusion_text = f"""
         This comprehensive analysis of {engagement_stats['total_tweets']} job-related tweets provides 
@@ -535,16 +727,11 @@ class TwitterJobAnalysisFullPDFReport:
         For ongoing optimization, regular analysis updates are recommended to track performance 
         improvements and adapt to evolving market conditions.
         """
-        content.append(Paragraph(conclusion_text, styles['Normal']))
+        content.append(Paragraph(conclusion_text, _STYLES['Normal']))
         
         # Build PDF
         doc.build(content)
         
-        # Clean up chart files
-        for chart_file in chart_files:
-            if os.path.exists(chart_file):
-                os.remove(chart_file)
-        
         print(f"\n✅ Complete PDF report with all 12 charts generated successfully!")
         print(f"📄 Report saved as: {pdf_filename}")
         print(f"\n📊 Report includes:")
@@ -561,12 +748,15 @@ class TwitterJobAnalysisFullPDFReport:
         return pdf_filename
 
 # Execute the complete PDF report generation
-def generate_complete_pdf_report():
-    """Generate comprehensive PDF report with all 12 visualizations"""
+def generate_complete_pdf_report(chunksize=None):
+    """Generate comprehensive PDF report with all 12 visualizations
+    
+    Pass chunksize (rows per chunk) to stream CSVs that are too large to load at once.
+    """
     print("🚀 Starting Complete PDF Report Generation with All 12 Charts...")
     
     try:
-        analyzer = TwitterJobAnalysisFullPDFReport('twitter_job_analysis.csv')
+        analyzer = TwitterJobAnalysisFullPDFReport('twitter_job_analysis.csv', chunksize=chunksize)
         
         if analyzer.df is None:
             print("❌ Failed to load data. Please ensure twitter_job_analysis.csv exists.")
@@ -590,12 +780,4 @@ def generate_complete_pdf_report():
 
 # Run the complete PDF generation
 if __name__ == "__main__":
-    # Install required package first
-    print("📦 Installing ReportLab for PDF generation...")
-    import subprocess
-    try:
-        subprocess.check_call(['pip', 'install', 'reportlab'])
-    except:
-        print("Please install reportlab manually: pip install reportlab")
-    
     pdf_report = generate_complete_pdf_report()
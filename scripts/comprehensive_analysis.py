@@ -1,52 +1,115 @@
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; the dashboard is only saved to PNG
 import matplotlib.pyplot as plt
 import numpy as np
-from collections import Counter
 import itertools
 import re
-from textblob import TextBlob
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from datetime import datetime
+from functools import cached_property
+from concurrent.futures import ProcessPoolExecutor
+import os
 import warnings
 warnings.filterwarnings('ignore')
 
+# Batch rendering: simplify dense line paths and draw long paths in chunks
+plt.rcParams.update({
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000
+})
+
+# Columns used by the analyses and their schema in the scraper's CSV output
+_CSV_DTYPES = {
+    'Username': 'category',
+    'Tweet': 'string',
+    'Date': 'string',
+    'Time': 'string',
+    'Mentions': 'string',
+    'Hashtags': 'string',
+    'Likes': 'int64',
+    'Retweets': 'int64',
+    'Replies': 'int64',
+    'Views': 'int64'
+}
+
+# Bumped whenever prepare_frame changes, so parquet caches from older runs are rebuilt
+_CACHE_VERSION = 2
+
+# Non-empty, whitespace-stripped items of a comma-separated list
+_LIST_ITEM_RE = re.compile(r'[^,\s](?:[^,]*[^,\s])?')
+
+# Keyword extraction patterns, compiled once (URLs and @/# handles stripped in one pass)
+_URL_HANDLE_RE = re.compile(r'http\S+|www\S+|[@#]\w+')
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+_STOPWORDS = frozenset({'the', 'and', 'for', 'are', 'with', 'this', 'that', 'you', 'your',
+                        'our', 'can', 'will', 'have', 'has', 'been', 'from', 'they', 'them',
+                        'job', 'jobs', 'work', 'career', 'hiring', 'vacancy', 'naukri'})
+
+# Upper bound on points drawn in the engagement vs views scatter plot
+_MAX_SCATTER_POINTS = 5000
+
+_N_WORKERS = os.cpu_count() or 1
+
+def _peak(counts, default):
+    """Return the (label, count) of the largest entry in a counts Series"""
+    if counts.empty:
+        return default, 0
+    i = counts.to_numpy().argmax()
+    return counts.index[i], int(counts.iloc[i])
+
+def _score_chunk(texts, use_textblob=False):
+    """Score a chunk of tweets with VADER, or legacy TextBlob (runs in a worker process)"""
+    if use_textblob:
+        # Optional dependency, only needed for the legacy scorer
+        from textblob import TextBlob
+        
+        def get_sentiment(text):
+            try:
+                return TextBlob(str(text)).sentiment.polarity
+            except:
+                return 0
+    else:
+        polarity_scores = TwitterJobAnalysisReport._analyzer.polarity_scores
+        def get_sentiment(text):
+            return polarity_scores(str(text))['compound']
+    
+    return [get_sentiment(text) for text in texts]
+
 class TwitterJobAnalysisReport:
-    def __init__(self, csv_file='twitter_job_analysis.csv'):
+    # VADER's lexicon is loaded once and shared by every report
+    _analyzer = SentimentIntensityAnalyzer()
+    
+    def __init__(self, csv_file='twitter_job_analysis.csv', use_textblob=False):
         self.csv_file = csv_file
+        self.use_textblob = use_textblob  # legacy TextBlob scoring, for regression checks
         self.df = None
         self.load_and_prepare_data()
     
     def load_and_prepare_data(self):
         """Load and prepare the CSV data"""
         try:
-            self.df = pd.read_csv(self.csv_file)
-            print(f"✅ Successfully loaded {len(self.df)} tweets from {self.csv_file}")
-            
-            # Handle datetime parsing
-            try:
-                self.df['datetime'] = pd.to_datetime(self.df['Date'] + ' ' + self.df['Time'], errors='coerce')
-            except:
-                clean_time = self.df['Time'].str.replace(r'\.\d+', '', regex=True)
-                self.df['datetime'] = pd.to_datetime(self.df['Date'] + ' ' + clean_time, errors='coerce')
-            
-            # Parse hashtags and mentions
-            self.df['hashtags_list'] = self.df['Hashtags'].apply(self.parse_list)
-            self.df['mentions_list'] = self.df['Mentions'].apply(self.parse_list)
+            # Reuse the frame prepared by an earlier run while the CSV is unchanged
+            cache_path = self.csv_file + '.parquet'
+            if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(self.csv_file):
+                cached = pd.read_parquet(cache_path)
+                if cached.attrs.get('cache_version') == _CACHE_VERSION:
+                    self.df = cached
+                    print(f"✅ Successfully loaded {len(self.df)} prepared tweets from {cache_path}")
             
-            # Ensure numeric columns
-            for col in ['Likes', 'Retweets', 'Replies', 'Views']:
-                self.df[col] = pd.to_numeric(self.df[col], errors='coerce').fillna(0)
-            
-            # Calculate engagement metrics
-            self.df['total_engagement'] = self.df['Likes'] + self.df['Retweets'] + self.df['Replies']
-            self.df['engagement_rate'] = np.where(
-                self.df['Views'] > 0, 
-                (self.df['total_engagement'] / self.df['Views']) * 100, 
-                0
-            )
-            
-            # Add time features
-            self.df['hour'] = self.df['datetime'].dt.hour
-            self.df['day_of_week'] = self.df['datetime'].dt.day_name()
+            if self.df is None:
+                # Multi-threaded pyarrow parser reading only the needed columns with an explicit
+                # schema; usernames repeat heavily, so category codes speed up nunique/value_counts
+                self.df = pd.read_csv(self.csv_file, engine='pyarrow', usecols=list(_CSV_DTYPES), dtype=_CSV_DTYPES)
+                print(f"✅ Successfully loaded {len(self.df)} tweets from {self.csv_file}")
+                
+                self.prepare_frame(self.df)
+                self.df.attrs['cache_version'] = _CACHE_VERSION
+                try:
+                    self.df.to_parquet(cache_path)
+                except OSError as e:
+                    print(f"⚠️ Could not cache prepared data: {e}")
             
             print(f"📊 Data prepared: {len(self.df)} tweets from {self.df['Username'].nunique()} users")
             
@@ -54,55 +117,101 @@ class TwitterJobAnalysisReport:
             print(f"❌ Error loading data: {e}")
             return None
     
-    def parse_list(self, text):
-        """Parse comma-separated string to list"""
-        if pd.isna(text) or text == '' or str(text).lower() == 'nan':
-            return []
-        return [item.strip() for item in str(text).split(',') if item.strip()]
+    def prepare_frame(self, df):
+        """Add the derived columns used by the analyses to a raw CSV frame"""
+        # Handle datetime parsing (ISO8601 also accepts fractional seconds)
+        df['datetime'] = pd.to_datetime(
+            df['Date'] + ' ' + df['Time'], format='ISO8601', errors='coerce', cache=True
+        )
+        
+        # Parse hashtags and mentions
+        df['hashtags_list'] = self.parse_list(df['Hashtags'])
+        df['mentions_list'] = self.parse_list(df['Mentions'])
+        
+        # Calculate engagement metrics
+        engagement = df['Likes'].to_numpy() + df['Retweets'].to_numpy() + df['Replies'].to_numpy()
+        df['total_engagement'] = engagement
+        # Divide only where Views > 0; zero-view rows keep a rate of 0
+        views = df['Views'].to_numpy()
+        rate = np.zeros(len(engagement), dtype=np.float64)
+        np.divide(engagement, views, out=rate, where=views > 0)
+        rate *= 100
+        df['engagement_rate'] = rate
+        
+        # Add time features
+        df['hour'] = df['datetime'].dt.hour
+        df['day_of_week'] = df['datetime'].dt.day_name()
+        
+        # Tweet length, computed once for the length distribution
+        df['tweet_len'] = df['Tweet'].str.len().fillna(0).astype(np.int32)
+        
+        return df
+    
+    def parse_list(self, column):
+        """Parse a column of comma-separated strings to lists"""
+        # Only non-empty rows go through the regex; missing/blank rows get empty lists
+        mask = (column.notna() & (column != '')).to_numpy(dtype=bool)
+        lists = pd.Series([[] for _ in range(len(column))], index=column.index, dtype=object)
+        lists[mask] = column[mask].astype(str).str.findall(_LIST_ITEM_RE)
+        return lists
     
-    def perform_sentiment_analysis(self):
+    @cached_property
+    def sentiment_dist(self):
         """Perform sentiment analysis on tweets"""
-        def get_sentiment(text):
-            try:
-                return TextBlob(str(text)).sentiment.polarity
-            except:
-                return 0
-        
-        def classify_sentiment(score):
-            if score > 0.1:
-                return 'Positive'
-            elif score < -0.1:
-                return 'Negative'
-            else:
-                return 'Neutral'
-        
-        self.df['sentiment_score'] = self.df['Tweet'].apply(get_sentiment)
-        self.df['sentiment_label'] = self.df['sentiment_score'].apply(classify_sentiment)
+        # Score each distinct tweet once (retweets/reposts are common) and map back
+        codes, unique_tweets = pd.factorize(self.df['Tweet'], use_na_sentinel=False)
+        texts = list(unique_tweets)
+        
+        # Lexicon scoring is CPU-bound pure Python, so spread the chunks across all cores
+        chunk_size = max(1, -(-len(texts) // _N_WORKERS))
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        with ProcessPoolExecutor(max_workers=_N_WORKERS) as executor:
+            results = executor.map(_score_chunk, chunks, itertools.repeat(self.use_textblob))
+            unique_scores = np.fromiter(itertools.chain.from_iterable(results), dtype=float, count=len(texts))
+        scores = unique_scores[codes]
+        
+        # VADER compound score uses the standard +/-0.05 cut-offs, TextBlob the original +/-0.1
+        threshold = 0.1 if self.use_textblob else 0.05
+        
+        self.df['sentiment_score'] = scores
+        self.df['sentiment_label'] = np.select(
+            [scores > threshold, scores < -threshold],
+            ['Positive', 'Negative'],
+            default='Neutral'
+        )
         
         return self.df['sentiment_label'].value_counts()
     
-    def analyze_hashtags(self):
+    @cached_property
+    def hashtag_counts(self):
         """Analyze hashtag usage"""
-        all_hashtags = list(itertools.chain(*self.df['hashtags_list']))
-        return Counter(all_hashtags).most_common(15)
+        hashtag_counts = self.df['hashtags_list'].explode().dropna().value_counts()
+        
+        # Record summary figures from the same counts for the report
+        self._unique_hashtag_count = len(hashtag_counts)
+        self._avg_hashtags_per_tweet = int(hashtag_counts.sum()) / len(self.df)
+        
+        return [(tag, int(count)) for tag, count in hashtag_counts.head(15).items()]
     
-    def analyze_keywords(self):
+    @cached_property
+    def keyword_counts(self):
         """Extract and analyze keywords"""
-        def extract_keywords(text):
-            text = re.sub(r'http\S+|www\S+|https\S+', '', str(text), flags=re.MULTILINE)
-            text = re.sub(r'@\w+|#\w+', '', text)
-            words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-            stopwords = {'the', 'and', 'for', 'are', 'with', 'this', 'that', 'you', 'your', 
-                        'our', 'can', 'will', 'have', 'has', 'been', 'from', 'they', 'them',
-                        'job', 'jobs', 'work', 'career', 'hiring', 'vacancy', 'naukri'}
-            return [word for word in words if word not in stopwords and len(word) > 2]
-        
-        all_words = list(itertools.chain(*self.df['Tweet'].apply(extract_keywords)))
-        return Counter(all_words).most_common(20)
+        # Strip URLs/handles and tokenize with vectorized string methods
+        words = (
+            self.df['Tweet'].astype(str)
+            .str.replace(_URL_HANDLE_RE, '', regex=True)
+            .str.lower()
+            .str.findall(_WORD_RE)
+            .explode()
+            .dropna()
+        )
+        keyword_counts = words[~words.isin(_STOPWORDS)].value_counts().head(20)
+        return [(word, int(count)) for word, count in keyword_counts.items()]
     
-    def analyze_engagement(self):
+    @cached_property
+    def engagement_stats(self):
         """Analyze engagement patterns"""
-        stats = {
+        return {
             'total_tweets': len(self.df),
             'unique_users': self.df['Username'].nunique(),
             'total_likes': int(self.df['Likes'].sum()),
@@ -116,35 +225,50 @@ class TwitterJobAnalysisReport:
             'avg_engagement': float(self.df['total_engagement'].mean()),
             'max_engagement': int(self.df['total_engagement'].max())
         }
-        
-        top_tweets = self.df.nlargest(5, 'total_engagement')[
+    
+    @cached_property
+    def top_tweets(self):
+        """Find the 5 most engaging tweets"""
+        return self.df.nlargest(5, 'total_engagement')[
             ['Username', 'Tweet', 'total_engagement', 'Likes', 'Retweets', 'Replies']
         ]
-        
-        return stats, top_tweets
     
-    def analyze_temporal_patterns(self):
+    @cached_property
+    def temporal_data(self):
         """Analyze temporal patterns"""
-        hourly_activity = self.df['hour'].value_counts().sort_index()
+        # groupby returns the hours already sorted
+        hourly_activity = self.df.groupby('hour').size()
         daily_activity = self.df['day_of_week'].value_counts()
         user_activity = self.df['Username'].value_counts().head(10)
         
+        # Peaks are resolved once into plain scalars for the report
+        peak_hour, peak_hour_count = _peak(hourly_activity, 12)
+        peak_day, peak_day_count = _peak(daily_activity, 'Monday')
+        
         return {
             'hourly': hourly_activity,
             'daily': daily_activity,
             'users': user_activity,
-            'peak_hour': int(hourly_activity.idxmax()) if not hourly_activity.empty else 12,
-            'peak_day': str(daily_activity.idxmax()) if not daily_activity.empty else 'Monday'
+            'peak_hour': int(peak_hour),
+            'peak_hour_count': peak_hour_count,
+            'peak_day': str(peak_day),
+            'peak_day_count': peak_day_count
         }
     
+    def _run_analyses(self):
+        """Run all analyses (each is memoized) without any plotting"""
+        return (self.sentiment_dist, self.hashtag_counts, self.keyword_counts,
+                self.engagement_stats, self.top_tweets, self.temporal_data)
+    
     def create_comprehensive_visualizations(self):
         """Create comprehensive visualization dashboard"""
-        # Perform all analyses
-        sentiment_dist = self.perform_sentiment_analysis()
-        hashtag_counts = self.analyze_hashtags()
-        keyword_counts = self.analyze_keywords()
-        engagement_stats, top_tweets = self.analyze_engagement()
-        temporal_data = self.analyze_temporal_patterns()
+        results = self._run_analyses()
+        self.plot_dashboard(results)
+        return results
+    
+    def plot_dashboard(self, results):
+        """Render the 12-panel dashboard for the given analysis results"""
+        sentiment_dist, hashtag_counts, keyword_counts, engagement_stats, top_tweets, temporal_data = results
         
         # Create figure with subplots
         fig = plt.figure(figsize=(20, 24))
@@ -232,15 +356,18 @@ class TwitterJobAnalysisReport:
         
         # 10. Tweet Length Distribution
         plt.subplot(4, 3, 10)
-        tweet_lengths = self.df['Tweet'].str.len()
-        plt.hist(tweet_lengths, bins=20, alpha=0.7, color='gold', edgecolor='black')
+        plt.hist(self.df['tweet_len'], bins=20, alpha=0.7, color='gold', edgecolor='black')
         plt.title('Tweet Length Distribution', fontsize=14, fontweight='bold')
         plt.xlabel('Tweet Length (characters)')
         plt.ylabel('Frequency')
         
         # 11. Engagement vs Views Scatter
         plt.subplot(4, 3, 11)
-        plt.scatter(self.df['Views'], self.df['total_engagement'], alpha=0.6, color='navy')
+        # Large datasets are down-sampled; a fixed seed keeps the dashboard reproducible
+        points = self.df[['Views', 'total_engagement']]
+        if len(points) > _MAX_SCATTER_POINTS:
+            points = points.sample(_MAX_SCATTER_POINTS, random_state=0)
+        plt.scatter(points['Views'], points['total_engagement'], alpha=0.6, color='navy')
         plt.xlabel('Views')
         plt.ylabel('Total Engagement')
         plt.title('Engagement vs Views', fontsize=14, fontweight='bold')
@@ -248,7 +375,7 @@ class TwitterJobAnalysisReport:
         
         # 12. Top Tweets by Engagement
         plt.subplot(4, 3, 12)
-        top_5_tweets = self.df.nlargest(5, 'total_engagement')
+        top_5_tweets = top_tweets
         plt.barh(range(len(top_5_tweets)), top_5_tweets['total_engagement'], color='gold')
         plt.yticks(range(len(top_5_tweets)), 
                   [f"@{user[:10]}..." for user in top_5_tweets['Username']])
@@ -258,15 +385,21 @@ class TwitterJobAnalysisReport:
         plt.tight_layout(pad=3.0)
         plt.savefig('comprehensive_twitter_analysis.png', dpi=300, bbox_inches='tight')
         plt.close()
-        
-        return sentiment_dist, hashtag_counts, keyword_counts, engagement_stats, top_tweets, temporal_data
     
-    def generate_comprehensive_report(self):
+    def generate_comprehensive_report(self, include_visualizations=False):
         """Generate comprehensive PDF-style report"""
         print("🚀 Generating comprehensive Twitter job data analysis report...")
         
-        # Create visualizations and get analysis data
-        sentiment_dist, hashtag_counts, keyword_counts, engagement_stats, top_tweets, temporal_data = self.create_comprehensive_visualizations()
+        # Get analysis data, rendering the dashboard only when it is wanted
+        if include_visualizations:
+            results = self.create_comprehensive_visualizations()
+        else:
+            results = self._run_analyses()
+        sentiment_dist, hashtag_counts, keyword_counts, engagement_stats, top_tweets, temporal_data = results
+        
+        # Only point at the dashboard when this run wrote it
+        visualization_line = "\nVisualization: comprehensive_twitter_analysis.png" if include_visualizations else ""
+        dashboard_line = "\nVisualization dashboard: comprehensive_twitter_analysis.png" if include_visualizations else ""
         
         # Generate comprehensive text report
         report_content = f"""
@@ -274,8 +407,7 @@ class TwitterJobAnalysisReport:
 COMPREHENSIVE TWITTER JOB DATA ANALYSIS REPORT
 {'='*80}
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Data Source: {self.csv_file}
-Visualization: comprehensive_twitter_analysis.png
+Data Source: {self.csv_file}{visualization_line}
 
 {'='*80}
 EXECUTIVE SUMMARY
@@ -323,8 +455,8 @@ Top 15 Most Popular Hashtags:
         for i, (hashtag, count) in enumerate(hashtag_counts[:15], 1):
             report_content += f"{i:2d}. {hashtag}: {count} occurrences\n"
         
-        total_hashtags = len(set(itertools.chain(*self.df['hashtags_list'])))
-        avg_hashtags = self.df['hashtags_list'].apply(len).mean()
+        total_hashtags = self._unique_hashtag_count
+        avg_hashtags = self._avg_hashtags_per_tweet
         
         report_content += f"""
 Hashtag Statistics:
@@ -354,8 +486,8 @@ Average Engagement per Tweet:
 {'='*80}
 
 Peak Activity Patterns:
-• Peak Hour: {temporal_data['peak_hour']}:00 ({temporal_data['hourly'][temporal_data['peak_hour']]} tweets)
-• Most Active Day: {temporal_data['peak_day']} ({temporal_data['daily'][temporal_data['peak_day']]} tweets)
+• Peak Hour: {temporal_data['peak_hour']}:00 ({temporal_data['peak_hour_count']} tweets)
+• Most Active Day: {temporal_data['peak_day']} ({temporal_data['peak_day_count']} tweets)
 
 {'='*80}
 5. ACTIONABLE RECOMMENDATIONS
@@ -386,8 +518,7 @@ The analysis reveals a {sentiment_dist.idxmax().lower()} sentiment landscape wit
 at {temporal_data['peak_hour']}:00 on {temporal_data['peak_day']}s.
 
 Report generated by Twitter Job Data Analyzer
-Analysis completed on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Visualization dashboard: comprehensive_twitter_analysis.png
+Analysis completed on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}{dashboard_line}
 
 {'='*80}
 END OF REPORT
@@ -401,7 +532,8 @@ END OF REPORT
         
         print(f"\n✅ Comprehensive analysis completed successfully!")
         print(f"📄 Report saved as: {report_filename}")
-        print(f"📊 Visualization saved as: comprehensive_twitter_analysis.png")
+        if include_visualizations:
+            print(f"📊 Visualization saved as: comprehensive_twitter_analysis.png")
         print(f"\n📋 Analysis Summary:")
         print(f"   • {engagement_stats['total_tweets']} tweets analyzed")
         print(f"   • {engagement_stats['unique_users']} unique users")
@@ -422,7 +554,7 @@ def run_comprehensive_analysis():
             print("❌ Failed to load data. Please ensure twitter_job_analysis.csv exists.")
             return None
         
-        report = analyzer.generate_comprehensive_report()
+        report = analyzer.generate_comprehensive_report(include_visualizations=True)
         
         print("\n🎯 Analysis Complete! Files Generated:")
         print("   📊 comprehensive_twitter_analysis.png (12-panel visualization dashboard)")
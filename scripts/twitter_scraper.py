@@ -1,5 +1,6 @@
-import time
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -7,97 +8,267 @@ from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.common.exceptions import TimeoutException
 from datetime import datetime
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import os
 import re
+import sys
+import csv
 import json
+import shutil
+import tempfile
 from tqdm import tqdm
 
-def save_to_csv(tweets_data, filename='twitter_job_data.csv'):
+# Tweet text and metric patterns, compiled once for the extraction loop
+_HASHTAG_RE = re.compile(r'#\w+')
+_MENTION_RE = re.compile(r'@(\w+)')  # captures the handle without the '@'
+_NUM_COMMA_RE = re.compile(r'[\d,]+')
+_STATUS_ID_RE = re.compile(r'/status/(\d+)')
+# Button aria-labels open with the count: "1,234 Likes. Like", "3 reposts. Repost"
+_LABEL_COUNT_RE = re.compile(r'\d[\d,]*')
+
+# Metric counts: thousands separators dropped in one translate pass, then a leading number
+# (optionally after a "Views" label) with an optional K/M/B suffix: "1.2K views", "Views 1,234".
+# Text that does not open with a count, like "Mar 5", is 0
+_METRIC_STRIP = str.maketrans('', '', ',')
+_METRIC_RE = re.compile(r'\s*(?:views?:?\s+)?(\d+(?:\.\d+)?)(?:\s?([KMB])(?![A-Za-z]))?', re.IGNORECASE)
+_METRIC_MULTIPLIERS = {'K': 1_000, 'M': 1_000_000, 'B': 1_000_000_000}
+
+# Persistent Chrome profile for the CLI and the pool (worker i uses '<dir>_<i>'), so cookies
+# survive between runs and the login splash is skipped
+_PROFILE_DIR = os.path.expanduser('~/.tw_profile')
+
+# Stop scrolling once the timeline keeps returning tweets we already have
+_DUP_WINDOW = 5
+_DUP_RATIO_LIMIT = 0.95
+
+_OUTPUT_FORMATS = ('csv', 'parquet', 'feather')
+
+# Keys of the tweet dicts built by TwitterScraper.extract_single_tweet that get saved
+_TWEET_FIELDS = ['username', 'tweet', 'date_time', 'mentions', 'hashtags',
+                 'likes', 'retweets', 'comments', 'replies', 'views']
+
+# Explicit dtypes for the scraped and saved frames: contiguous ints instead of inferred
+# objects, and arrow-backed text (on pandas 2.x too) instead of Python str objects
+_TWEET_DTYPES = {
+    'username': 'string[pyarrow]',
+    'tweet': 'string[pyarrow]',
+    'likes': 'int32',
+    'retweets': 'int32',
+    'comments': 'int32',
+    'replies': 'int32',
+    'views': 'int64'
+}
+
+_OUTPUT_DTYPES = {
+    'Username': 'string[pyarrow]',
+    'Tweet': 'string[pyarrow]',
+    'Date': 'string[pyarrow]',
+    'Time': 'string[pyarrow]',
+    'Mentions': 'string[pyarrow]',
+    'Hashtags': 'string[pyarrow]',
+    'Likes': 'int32',
+    'Retweets': 'int32',
+    'Comments': 'int32',
+    'Replies': 'int32',
+    'Views': 'int64'
+}
+
+# Collects the raw fields of every tweet on the page in a single WebDriver round trip,
+# instead of a find_element/get_attribute call per field per tweet. Cards are tagged
+# data-scraped once their text has been read, so later scrolls only parse new ones;
+# cardCount still counts every card on the page, tagged or not
+_EXTRACT_TWEETS_JS = """
+const cardCount = document.querySelectorAll('[data-testid="tweet"]').length;
+const tweets = Array.from(document.querySelectorAll('[data-testid="tweet"]:not([data-scraped])'), tweet => {
+    const find = selector => tweet.querySelector(selector);
+    const attr = (selector, name) => { const el = find(selector); return el ? el.getAttribute(name) : null; };
+    const handle = Array.from(tweet.querySelectorAll('[data-testid="User-Name"] span'), span => span.innerText)
+        .find(text => text.startsWith('@'));
+    const tweetText = find('[data-testid="tweetText"]');
+    const analytics = find('[href*="analytics"]');
+    // One pass over the engagement buttons, keeping the first label of each kind
+    const labels = {};
+    tweet.querySelectorAll('[data-testid="like"], [data-testid="retweet"], [data-testid="reply"]').forEach(button => {
+        const kind = button.getAttribute('data-testid');
+        if (!(kind in labels)) labels[kind] = button.getAttribute('aria-label');
+    });
+    // The timestamp links to the tweet itself; a quoted tweet's link comes later in the card
+    const time = find('time');
+    const status = (time && time.closest('a[href*="/status/"]')) || find('a[href*="/status/"]');
+    // Cards still waiting on their text stay untagged and are picked up next round
+    if (tweetText) tweet.setAttribute('data-scraped', '1');
+    return {
+        statusHref: status ? status.getAttribute('href') : null,
+        handle: handle || null,
+        profileHref: attr('[data-testid="User-Name"] a', 'href'),
+        tweet: tweetText ? tweetText.innerText : null,
+        dateTime: attr('time', 'datetime'),
+        likeLabel: labels.like ?? null,
+        retweetLabel: labels.retweet ?? null,
+        replyLabel: labels.reply ?? null,
+        analyticsLabel: analytics ? (analytics.getAttribute('aria-label') || '') : null,
+        viewTexts: analytics ? [] : Array.from(
+            tweet.querySelectorAll('[role="group"] span, [role="button"] span'), span => span.innerText
+        )
+    };
+});
+return JSON.stringify({cardCount: cardCount, tweets: tweets});
+"""
+
+def _label_count(label):
+    """Count at the start of an engagement button's aria-label, 0 when it has none"""
+    match = _LABEL_COUNT_RE.match(label or '')
+    return int(match.group().replace(',', '')) if match else 0
+
+def _status_id(raw_tweet):
+    """Numeric tweet id from the card's status link, None when it has none"""
+    status = _STATUS_ID_RE.search(raw_tweet.get('statusHref') or '')
+    return int(status.group(1)) if status else None
+
+def _dedup_key(tweet_data):
+    """Tweet id when the card exposed one, else the (username, tweet) pair"""
+    return tweet_data.get('tweet_id') or (tweet_data.get('username'), tweet_data.get('tweet'))
+
+def _split_date_time(date_time):
+    """Date and time strings of one ISO timestamp, matching the save_tweets columns"""
+    if not date_time:
+        return '', ''
+    try:
+        dt_obj = pd.to_datetime(date_time, format='ISO8601', utc=True).tz_localize(None)
+    except (ValueError, TypeError):
+        # Fallback to current date/time if parsing fails
+        dt_obj = pd.Timestamp.now()
+    return dt_obj.strftime('%Y-%m-%d'), dt_obj.strftime('%H:%M:%S')
+
+def _check_format(format):
+    """Reject output formats save_tweets cannot write"""
+    if format not in _OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format '{format}', expected one of {_OUTPUT_FORMATS}")
+
+def _write_frame(df, filename, format):
+    """Write an output-layout frame as CSV, Parquet or Feather and print a preview"""
+    # Columnar formats are smaller on disk and much faster to read back than CSV
+    if format == 'parquet':
+        df.to_parquet(filename, compression='snappy', index=False)
+    elif format == 'feather':
+        df.to_feather(filename)
+    else:
+        # Arrow's multithreaded CSV writer is an order of magnitude faster than DataFrame.to_csv
+        pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filename)
+    
+    print(f"\n✅ {format.upper()} file '{filename}' generated successfully!")
+    print(f"📊 Total records saved: {len(df)}")
+    print(f"📁 File location: {filename}")
+    
+    # Display preview of the data
+    print(f"\n📋 Preview of saved data:")
+    print(df.head().to_string(index=False))
+
+def save_tweets(tweets_data, filename='twitter_job_data.csv', format='csv'):
     """
-    Save tweets data to CSV with specified column format
+    Save tweets data with specified column format as CSV, Parquet or Feather
     """
+    _check_format(format)
+    
     if not tweets_data:
         print("No data to save!")
         return None
     
-    # Prepare data for CSV with specified columns
-    data_for_csv = []
-    
-    for tweet in tweets_data:
-        # Extract date and time separately from ISO datetime
-        date_time = tweet.get('date_time', '')
-        date = ''
-        time = ''
-        
-        if date_time:
-            try:
-                # Parse the datetime string
-                if 'T' in date_time:
-                    dt_obj = pd.to_datetime(date_time)
-                else:
-                    dt_obj = pd.to_datetime(date_time)
-                
-                date = dt_obj.date().isoformat()
-                time = dt_obj.time().isoformat()
-            except Exception as e:
-                # Fallback to current date/time if parsing fails
-                now = datetime.now()
-                date = now.date().isoformat()
-                time = now.time().isoformat()
-        
-        # Format mentions and hashtags as comma-separated strings
-        mentions_str = ','.join(tweet.get('mentions', []))
-        hashtags_str = ','.join(tweet.get('hashtags', []))
-        
-        data_for_csv.append({
-            'Username': tweet.get('username', ''),
-            'Tweet': tweet.get('tweet', ''),
-            'Date': date,
-            'Time': time,
-            'Mentions': mentions_str,
-            'Hashtags': hashtags_str,
-            'Likes': tweet.get('likes', 0),
-            'Retweets': tweet.get('retweets', 0),
-            'Comments': tweet.get('comments', 0),
-            'Replies': tweet.get('replies', 0),
-            'Views': tweet.get('views', 0)
-        })
-    
-    # Create DataFrame and save to CSV
-    df = pd.DataFrame(data_for_csv)
-    df.to_csv(filename, index=False, encoding='utf-8')
+    # Build the frame once and derive the CSV columns with vectorized operations
+    tweets = pd.DataFrame(tweets_data).reindex(columns=_TWEET_FIELDS)
     
-    print(f"\n✅ CSV file '{filename}' generated successfully!")
-    print(f"📊 Total records saved: {len(df)}")
-    print(f"📁 File location: {filename}")
+    # Extract date and time separately from ISO datetime (left empty when missing)
+    date_time = tweets['date_time'].fillna('').astype(str)
+    dt_obj = pd.to_datetime(date_time, format='ISO8601', errors='coerce', utc=True).dt.tz_localize(None)
+    # Fallback to current date/time if parsing fails
+    dt_obj = dt_obj.mask(dt_obj.isna() & (date_time != ''), pd.Timestamp.now())
     
-    # Display preview of the data
-    print(f"\n📋 Preview of saved data:")
-    print(df.head().to_string(index=False))
+    df = pd.DataFrame({
+        'Username': tweets['username'].fillna(''),
+        'Tweet': tweets['tweet'].fillna(''),
+        'Date': dt_obj.dt.strftime('%Y-%m-%d').fillna(''),
+        'Time': dt_obj.dt.strftime('%H:%M:%S').fillna(''),
+        # Format mentions and hashtags as comma-separated strings
+        'Mentions': tweets['mentions'].str.join(',').fillna(''),
+        'Hashtags': tweets['hashtags'].str.join(',').fillna(''),
+        'Likes': tweets['likes'].fillna(0),
+        'Retweets': tweets['retweets'].fillna(0),
+        'Comments': tweets['comments'].fillna(0),
+        'Replies': tweets['replies'].fillna(0),
+        'Views': tweets['views'].fillna(0)
+    }).astype(_OUTPUT_DTYPES)
     
+    _write_frame(df, filename, format)
     return df
 
+def save_to_csv(tweets_data, filename='twitter_job_data.csv'):
+    """
+    Save tweets data to CSV with specified column format
+    """
+    return save_tweets(tweets_data, filename, 'csv')
+
 class TwitterScraper:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, user_data_dir=None, stream_to=None):
         """Initialize the Twitter scraper with Chrome driver"""
         self.driver = None
         self.tweets_data = []
-        self.setup_driver(headless)
+        self._seen_keys = set()  # tweet id of every collected tweet, for O(1) dedup
+        
+        # With stream_to, rows go straight to '<stream_to>.csv' instead of tweets_data
+        self._stream_file = f'{stream_to}.csv' if stream_to else None
+        self._csv_fh = None
+        self._writer = None
+        
+        # Chrome locks its profile directory, so without an explicit (persistent) one each
+        # scraper gets a private throwaway profile and concurrent runs never collide
+        self._temp_profile = None
+        if user_data_dir is None:
+            user_data_dir = self._temp_profile = tempfile.mkdtemp(prefix='tw_profile_')
+        
+        try:
+            self.setup_driver(headless, user_data_dir)
+        except Exception:
+            self._remove_temp_profile()
+            raise
+        
+        # Opened only once the driver is up, so a failed launch leaves no file handle behind
+        if self._stream_file:
+            self._csv_fh = open(self._stream_file, 'w', newline='', encoding='utf-8')
+            # Quote text but not counts, the same layout the Arrow CSV writer in save_tweets produces
+            self._writer = csv.DictWriter(self._csv_fh, fieldnames=list(_OUTPUT_DTYPES),
+                                          quoting=csv.QUOTE_NONNUMERIC, lineterminator='\n')
+            self._writer.writeheader()
     
-    def setup_driver(self, headless=False):
+    def setup_driver(self, headless=False, user_data_dir=None):
         """Setup Chrome driver with appropriate options"""
         chrome_options = Options()
         if headless:
             chrome_options.add_argument("--headless")
+        if user_data_dir:
+            # Reusing the profile keeps the session cookies and skips the login splash
+            chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_argument("--disable-extensions")
+        chrome_options.add_argument("--disable-gpu")
+        chrome_options.add_argument("--disable-background-networking")
+        
+        # Only the DOM is scraped: return from get() once it is parsed and never fetch images
+        chrome_options.page_load_strategy = 'eager'
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
         
-        service = Service(ChromeDriverManager().install())
+        # Selenium Manager (Selenium 4.6+) resolves the driver from its local cache;
+        # CHROMEDRIVER points at an explicit binary instead
+        chromedriver = os.environ.get('CHROMEDRIVER')
+        service = Service(executable_path=chromedriver) if chromedriver else Service()
         self.driver = webdriver.Chrome(service=service, options=chrome_options)
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
@@ -112,9 +283,8 @@ class TwitterScraper:
         print(f"🔍 Searching for: {search_query}")
         
         self.driver.get(search_url)
-        time.sleep(5)
         
-        # Handle potential login prompts or rate limiting
+        # Handle potential login prompts or rate limiting (waits for the first tweets)
         self.handle_initial_page()
         
         # Scroll and collect tweets
@@ -123,31 +293,38 @@ class TwitterScraper:
     def handle_initial_page(self):
         """Handle initial page load and potential prompts"""
         try:
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]'))
-            )
-        except:
+            # Wait for page to load; returns as soon as the first tweet or a login wall renders
+            element = WebDriverWait(self.driver, 15).until(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="tweet"]')),
+                EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="loginButton"]'))
+            ))
+            if element.get_attribute('data-testid') == 'loginButton':
+                print("⚠️ Twitter is showing a login prompt - results may be limited")
+        except TimeoutException:
             print("⚠️ Initial page load timeout - continuing anyway")
-            time.sleep(3)
     
     def infinite_scroll_and_scrape(self, max_tweets):
         """Implement infinite scrolling to load more tweets"""
         last_height = self.driver.execute_script("return document.body.scrollHeight")
         tweets_collected = 0
         scroll_attempts = 0
-        max_scroll_attempts = 100  # Increased for 2000 tweets
+        max_scroll_attempts = 20  # Page-growth waits make stalls reliable to detect
+        dup_ratios = deque(maxlen=_DUP_WINDOW)
         
         print(f"🚀 Starting to collect up to {max_tweets} tweets...")
         
         while tweets_collected < max_tweets and scroll_attempts < max_scroll_attempts:
             # Extract tweets from current view
-            current_tweets = self.extract_tweets_from_page()
+            current_tweets, card_count = self.extract_tweets_from_page()
             new_tweets = 0
             
             for tweet_data in current_tweets:
                 if tweet_data and not self.is_duplicate_tweet(tweet_data):
-                    self.tweets_data.append(tweet_data)
+                    if self._writer:
+                        self._write_row(tweet_data)
+                    else:
+                        self.tweets_data.append(tweet_data)
+                    self._seen_keys.add(_dedup_key(tweet_data))
                     tweets_collected += 1
                     new_tweets += 1
                     
@@ -156,38 +333,71 @@ class TwitterScraper:
             
             print(f"📝 Collected {new_tweets} new tweets. Total: {tweets_collected}/{max_tweets}")
             
+            # Bail out when recent rounds are almost entirely tweets we already have; every card
+            # on the page counts, including ones tagged or skipped as seen before parsing
+            dup_ratios.append(1 - new_tweets / max(1, card_count))
+            if len(dup_ratios) == _DUP_WINDOW and sum(dup_ratios) / _DUP_WINDOW > _DUP_RATIO_LIMIT:
+                print("⚠️ Timeline is only returning duplicates, stopping early")
+                break
+            
             # Scroll down to load more tweets
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
             
-            # Check if new content loaded
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                scroll_attempts += 1
-                time.sleep(2)
-            else:
+            # Wait until new content extends the page, rather than sleeping a fixed time
+            try:
+                WebDriverWait(self.driver, 5, poll_frequency=0.25).until(
+                    lambda driver: driver.execute_script("return document.body.scrollHeight") != last_height
+                )
                 scroll_attempts = 0
-                last_height = new_height
+                last_height = self.driver.execute_script("return document.body.scrollHeight")
+            except TimeoutException:
+                scroll_attempts += 1
+    
+    def _write_row(self, tweet_data):
+        """Write one tweet to the streamed CSV in the save_tweets layout"""
+        date_str, time_str = _split_date_time(tweet_data.get('date_time'))
+        self._writer.writerow({
+            'Username': tweet_data.get('username', ''),
+            'Tweet': tweet_data.get('tweet', ''),
+            'Date': date_str,
+            'Time': time_str,
+            'Mentions': ','.join(tweet_data.get('mentions', [])),
+            'Hashtags': ','.join(tweet_data.get('hashtags', [])),
+            'Likes': tweet_data.get('likes', 0),
+            'Retweets': tweet_data.get('retweets', 0),
+            'Comments': tweet_data.get('comments', 0),
+            'Replies': tweet_data.get('replies', 0),
+            'Views': tweet_data.get('views', 0)
+        })
+    
+    def _read_stream(self):
+        """Read the streamed CSV back as a saved-data frame"""
+        self._csv_fh.flush()
+        return pd.read_csv(self._stream_file, dtype=_OUTPUT_DTYPES, keep_default_na=False, encoding='utf-8')
     
     def is_duplicate_tweet(self, new_tweet):
         """Check if tweet is already collected"""
-        for existing_tweet in self.tweets_data:
-            if (existing_tweet.get('username') == new_tweet.get('username') and 
-                existing_tweet.get('tweet') == new_tweet.get('tweet')):
-                return True
-        return False
+        return _dedup_key(new_tweet) in self._seen_keys
     
     def extract_tweets_from_page(self):
-        """Extract tweet data from the current page"""
+        """Extract new tweet data from the current page, with the number of tweet cards seen"""
         tweets = []
+        card_count = 0
         
         try:
-            # Find all tweet containers
-            tweet_elements = self.driver.find_elements(By.CSS_SELECTOR, '[data-testid="tweet"]')
+            # One round trip returns the raw fields of every untagged tweet container
+            page = json.loads(self.driver.execute_script(_EXTRACT_TWEETS_JS))
+            raw_tweets = page['tweets']
+            card_count = page['cardCount']
+            # One fallback timestamp per round, shared by every tweet missing its <time>
+            now_iso = datetime.now().isoformat()
             
-            for tweet_element in tweet_elements:
+            for raw_tweet in raw_tweets:
+                # Known ids are skipped before any text or metric parsing
+                if _status_id(raw_tweet) in self._seen_keys:
+                    continue
                 try:
-                    tweet_data = self.extract_single_tweet(tweet_element)
+                    tweet_data = self.extract_single_tweet(raw_tweet, now_iso)
                     if tweet_data:
                         tweets.append(tweet_data)
                 except Exception as e:
@@ -196,65 +406,45 @@ class TwitterScraper:
         except Exception as e:
             print(f"❌ Error extracting tweets: {e}")
         
-        return tweets
+        return tweets, card_count
     
-    def extract_single_tweet(self, tweet_element):
-        """Extract data from a single tweet element"""
-        try:
-            tweet_data = {}
-            
-            # Extract username
-            try:
-                username_elements = tweet_element.find_elements(By.CSS_SELECTOR, '[data-testid="User-Name"] span')
-                for elem in username_elements:
-                    text = elem.text
-                    if text.startswith('@'):
-                        tweet_data['username'] = text.replace('@', '')
-                        break
-                else:
-                    # Fallback method
-                    username_element = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="User-Name"] a')
-                    href = username_element.get_attribute('href')
-                    if href:
-                        tweet_data['username'] = href.split('/')[-1]
-            except:
-                tweet_data['username'] = "Unknown"
-            
-            # Extract tweet text
-            try:
-                tweet_text_element = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="tweetText"]')
-                tweet_data['tweet'] = tweet_text_element.text
-            except:
-                tweet_data['tweet'] = ""
-            
-            # Skip if no tweet content
-            if not tweet_data['tweet']:
-                return None
-            
-            # Extract date and time
-            try:
-                time_element = tweet_element.find_element(By.CSS_SELECTOR, 'time')
-                tweet_data['date_time'] = time_element.get_attribute('datetime')
-            except:
-                tweet_data['date_time'] = datetime.now().isoformat()
-            
-            # Extract hashtags from tweet text
-            hashtags = re.findall(r'#\w+', tweet_data['tweet'])
-            tweet_data['hashtags'] = hashtags
-            
-            # Extract mentions from tweet text
-            mentions = re.findall(r'@\w+', tweet_data['tweet'])
-            tweet_data['mentions'] = [mention.replace('@', '') for mention in mentions]
-            
-            # Extract engagement metrics
-            tweet_data.update(self.extract_engagement_metrics(tweet_element))
-            
-            return tweet_data
-            
-        except Exception as e:
+    def extract_single_tweet(self, raw_tweet, now_iso=None):
+        """Build tweet data from the raw fields of a single tweet element"""
+        tweet_data = {}
+        
+        # Extract username (the @handle, falling back to the profile link)
+        if raw_tweet.get('handle'):
+            tweet_data['username'] = raw_tweet['handle'].replace('@', '')
+        elif raw_tweet.get('profileHref'):
+            tweet_data['username'] = raw_tweet['profileHref'].split('/')[-1]
+        else:
+            tweet_data['username'] = "Unknown"
+        
+        # Extract tweet text
+        tweet_data['tweet'] = raw_tweet.get('tweet') or ""
+        
+        # Skip if no tweet content
+        if not tweet_data['tweet']:
             return None
+        
+        # Extract the tweet id from its status link; identical texts no longer collide
+        tweet_data['tweet_id'] = _status_id(raw_tweet)
+        
+        # Extract date and time
+        tweet_data['date_time'] = raw_tweet.get('dateTime') or now_iso or datetime.now().isoformat()
+        
+        # Extract hashtags from tweet text (interned: the same few tags repeat across thousands of tweets)
+        tweet_data['hashtags'] = list(map(sys.intern, _HASHTAG_RE.findall(tweet_data['tweet'])))
+        
+        # Extract mentions from tweet text
+        tweet_data['mentions'] = list(map(sys.intern, _MENTION_RE.findall(tweet_data['tweet'])))
+        
+        # Extract engagement metrics
+        tweet_data.update(self.extract_engagement_metrics(raw_tweet))
+        
+        return tweet_data
     
-    def extract_engagement_metrics(self, tweet_element):
+    def extract_engagement_metrics(self, raw_tweet):
         """Extract likes, retweets, comments, replies, and views"""
         metrics = {
             'likes': 0,
@@ -264,100 +454,68 @@ class TwitterScraper:
             'views': 0
         }
         
-        try:
-            # Extract likes
-            try:
-                likes_button = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="like"]')
-                likes_text = likes_button.get_attribute('aria-label') or ''
-                if 'like' in likes_text.lower():
-                    numbers = re.findall(r'\d+', likes_text)
-                    if numbers:
-                        metrics['likes'] = int(numbers[0])
-            except:
-                pass
-            
-            # Extract retweets
-            try:
-                retweet_button = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="retweet"]')
-                retweet_text = retweet_button.get_attribute('aria-label') or ''
-                if 'retweet' in retweet_text.lower():
-                    numbers = re.findall(r'\d+', retweet_text)
-                    if numbers:
-                        metrics['retweets'] = int(numbers[0])
-            except:
-                pass
-            
-            # Extract replies
-            try:
-                reply_button = tweet_element.find_element(By.CSS_SELECTOR, '[data-testid="reply"]')
-                reply_text = reply_button.get_attribute('aria-label') or ''
-                if 'repl' in reply_text.lower():
-                    numbers = re.findall(r'\d+', reply_text)
-                    if numbers:
-                        metrics['replies'] = int(numbers[0])
-                        metrics['comments'] = metrics['replies']  # Twitter uses replies as comments
-            except:
-                pass
-            
-            # Extract views (alternative methods)
-            try:
-                # Method 1: Look for analytics link
-                analytics_link = tweet_element.find_element(By.CSS_SELECTOR, '[href*="analytics"]')
-                if analytics_link:
-                    aria_label = analytics_link.get_attribute('aria-label') or ''
-                    numbers = re.findall(r'[\d,]+', aria_label)
-                    if numbers:
-                        views_str = numbers[0].replace(',', '')
-                        metrics['views'] = int(views_str)
-            except:
-                # Method 2: Look for view count in various elements
-                try:
-                    view_elements = tweet_element.find_elements(By.CSS_SELECTOR, '[role="group"] span, [role="button"] span')
-                    for element in view_elements:
-                        text = element.text
-                        if any(indicator in text.lower() for indicator in ['view', 'k', 'm']) and any(char.isdigit() for char in text):
-                            metrics['views'] = self.parse_metric_count(text)
-                            break
-                except:
-                    pass
-                
-        except Exception as e:
-            pass
+        # Extract likes, retweets and replies from the counts leading their button labels
+        metrics['likes'] = _label_count(raw_tweet.get('likeLabel'))
+        metrics['retweets'] = _label_count(raw_tweet.get('retweetLabel'))
+        metrics['replies'] = _label_count(raw_tweet.get('replyLabel'))
+        metrics['comments'] = metrics['replies']  # Twitter uses replies as comments
+        
+        # Extract views (alternative methods)
+        aria_label = raw_tweet.get('analyticsLabel')
+        if aria_label is not None:
+            # Method 1: Look for analytics link
+            numbers = _NUM_COMMA_RE.findall(aria_label)
+            views_str = numbers[0].replace(',', '') if numbers else ''
+            if views_str:
+                metrics['views'] = int(views_str)
+        else:
+            # Method 2: Look for view count in various elements
+            for text in raw_tweet.get('viewTexts') or []:
+                if any(indicator in text.lower() for indicator in ['view', 'k', 'm']) and any(char.isdigit() for char in text):
+                    metrics['views'] = self.parse_metric_count(text)
+                    break
         
         return metrics
     
     def parse_metric_count(self, count_text):
         """Parse metric count text (e.g., '1.2K', '5M') to integer"""
-        if not count_text or count_text == '':
+        if not count_text:
             return 0
         
-        try:
-            count_text = count_text.strip().replace(',', '')
-            
-            if 'K' in count_text.upper():
-                return int(float(count_text.upper().replace('K', '')) * 1000)
-            elif 'M' in count_text.upper():
-                return int(float(count_text.upper().replace('M', '')) * 1000000)
-            else:
-                # Extract numbers from text
-                numbers = re.findall(r'\d+', count_text)
-                return int(numbers[0]) if numbers else 0
-        except:
+        match = _METRIC_RE.match(count_text.translate(_METRIC_STRIP))
+        if not match:
             return 0
+        
+        number, suffix = match.groups()
+        multiplier = _METRIC_MULTIPLIERS[suffix.upper()] if suffix else 1
+        return int(float(number) * multiplier)
     
     def save_data(self, filename='twitter_job_data', format='csv'):
-        """Save collected data to CSV file only"""
+        """Save collected data as CSV (default), Parquet or Feather"""
+        format = format.lower()
+        
+        if self._stream_file:
+            _check_format(format)
+            # Rows were already written while scrolling; convert only if another file was asked for
+            df = self._read_stream()
+            output_file = f'{filename}.{format}'
+            if os.path.abspath(output_file) == os.path.abspath(self._stream_file):
+                print(f"\n✅ CSV file '{self._stream_file}' streamed successfully!")
+                print(f"📊 Total records saved: {len(df)}")
+            else:
+                _write_frame(df, output_file, format)
+            self.print_data_summary(df)
+            return df
+        
         if not self.tweets_data:
             print("No data to save!")
             return None
         
-        if format.lower() == 'csv':
-            # Use the enhanced CSV function
-            df = save_to_csv(self.tweets_data, f'{filename}.csv')
-            
-            # Additional data validation and summary
-            self.print_data_summary(df)
-            
+        df = save_tweets(self.tweets_data, f'{filename}.{format}', format)
+        
+        # Additional data validation and summary
+        self.print_data_summary(df)
+        
         return df
     
     def print_data_summary(self, df):
@@ -366,18 +524,27 @@ class TwitterScraper:
         print(f"   • Total tweets: {len(df)}")
         print(f"   • Unique users: {df['Username'].nunique()}")
         print(f"   • Date range: {df['Date'].min()} to {df['Date'].max()}")
-        print(f"   • Total likes: {df['Likes'].sum():,}")
-        print(f"   • Total retweets: {df['Retweets'].sum():,}")
-        print(f"   • Total replies: {df['Replies'].sum():,}")
-        print(f"   • Average engagement per tweet: {(df['Likes'] + df['Retweets'] + df['Replies']).mean():.2f}")
+        # Column totals are summed once and reused for the per-tweet average
+        totals = df[['Likes', 'Retweets', 'Replies']].sum()
+        print(f"   • Total likes: {totals['Likes']:,}")
+        print(f"   • Total retweets: {totals['Retweets']:,}")
+        print(f"   • Total replies: {totals['Replies']:,}")
+        print(f"   • Average engagement per tweet: {totals.sum() / len(df):.2f}")
     
     def analyze_data(self):
         """Perform basic analysis on collected data"""
-        if not self.tweets_data:
+        # Streamed runs leave tweets_data empty; the seen set still records what was collected
+        if not self.tweets_data and not (self._stream_file and self._seen_keys):
             print("No data to analyze!")
             return
         
-        df = pd.DataFrame(self.tweets_data)
+        if self._stream_file:
+            # Streamed runs keep no tweets in memory, so read the CSV back once
+            df = self._read_stream().rename(columns=str.lower)
+            df['hashtags'] = df['hashtags'].str.findall(r'[^,]+')
+        else:
+            df = pd.DataFrame(self.tweets_data).astype(_TWEET_DTYPES)
+        df = df.eval('total_engagement = likes + retweets + replies')
         
         print("\n" + "="*50)
         print("📊 TWITTER DATA ANALYSIS REPORT")
@@ -394,12 +561,9 @@ class TwitterScraper:
             print(f"   @{user}: {count} tweets")
         
         # Most popular hashtags
-        all_hashtags = []
-        for hashtags in df['hashtags']:
-            all_hashtags.extend(hashtags)
+        hashtag_counts = df['hashtags'].explode().dropna().value_counts().head(10)
         
-        if all_hashtags:
-            hashtag_counts = pd.Series(all_hashtags).value_counts().head(10)
+        if not hashtag_counts.empty:
             print("\n#️⃣ Top 10 Hashtags:")
             for hashtag, count in hashtag_counts.items():
                 print(f"   {hashtag}: {count} times")
@@ -410,10 +574,9 @@ class TwitterScraper:
         print(f"   🔄 Average retweets: {df['retweets'].mean():.2f}")
         print(f"   💬 Average replies: {df['replies'].mean():.2f}")
         print(f"   👀 Average views: {df['views'].mean():.2f}")
-        print(f"   🎯 Total engagement: {df[['likes', 'retweets', 'replies']].sum().sum()}")
+        print(f"   🎯 Total engagement: {df['total_engagement'].sum()}")
         
         # Most engaging tweets
-        df['total_engagement'] = df['likes'] + df['retweets'] + df['replies']
         top_tweets = df.nlargest(5, 'total_engagement')[['username', 'tweet', 'total_engagement']]
         
         print("\n🏆 Top 5 Most Engaging Tweets:")
@@ -428,6 +591,82 @@ class TwitterScraper:
         """Close the browser driver"""
         if self.driver:
             self.driver.quit()
+        if self._csv_fh:
+            self._csv_fh.close()
+        self._remove_temp_profile()
+    
+    def _remove_temp_profile(self):
+        """Delete the throwaway profile created for this scraper, if any"""
+        if self._temp_profile:
+            shutil.rmtree(self._temp_profile, ignore_errors=True)
+            self._temp_profile = None
+
+def _scrape_worker(hashtags, max_tweets, headless, user_data_dir):
+    """Run one scraper with its own driver and profile, returning the collected tweets"""
+    scraper = None
+    try:
+        # Built inside the try: a Chrome that fails to start costs only this worker's hashtags
+        scraper = TwitterScraper(headless=headless, user_data_dir=user_data_dir)
+        scraper.search_hashtags(hashtags, max_tweets=max_tweets)
+        return scraper.tweets_data
+    except Exception as e:
+        print(f"❌ Worker for {', '.join(hashtags)} failed: {e}")
+        return scraper.tweets_data if scraper else []
+    finally:
+        if scraper:
+            scraper.close()
+
+class TwitterScraperPool:
+    def __init__(self, n_workers=4, headless=True, profile_dir=_PROFILE_DIR):
+        """Scrape hashtags in parallel, one browser per worker process"""
+        # Selenium drivers are not thread-safe, so workers are processes
+        self.n_workers = n_workers
+        self.headless = headless
+        # Worker i keeps its cookies in '<profile_dir>_<i>'; profile_dir=None gives each
+        # worker a throwaway profile instead
+        self.profile_dir = profile_dir
+        self.tweets_data = []
+    
+    def search_hashtags(self, hashtags, max_tweets=2000):
+        """Split the hashtags across workers and merge their tweets"""
+        n_workers = max(1, min(self.n_workers, len(hashtags)))
+        groups = [hashtags[i::n_workers] for i in range(n_workers)]
+        per_worker = -(-max_tweets // n_workers)
+        
+        print(f"🚀 Scraping {len(hashtags)} hashtags with {n_workers} workers...")
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            futures = [
+                # Chrome locks a profile directory, so each worker gets its own
+                executor.submit(_scrape_worker, group, per_worker, self.headless,
+                                f"{self.profile_dir}_{i}" if self.profile_dir else None)
+                for i, group in enumerate(groups)
+            ]
+            results = [future.result() for future in futures]
+        
+        # A tweet tagged with hashtags from two groups is found by both workers, and earlier
+        # calls may already hold it; like TwitterScraper, max_tweets caps this call's new tweets
+        seen_keys = {_dedup_key(tweet_data) for tweet_data in self.tweets_data}
+        new_tweets = 0
+        for tweet_data in (tweet for result in results for tweet in result):
+            if new_tweets >= max_tweets:
+                break
+            key = _dedup_key(tweet_data)
+            if key not in seen_keys:
+                seen_keys.add(key)
+                self.tweets_data.append(tweet_data)
+                new_tweets += 1
+        
+        print(f"✅ Collected {new_tweets} unique tweets. Total: {len(self.tweets_data)}")
+        return self.tweets_data
+    
+    def save_data(self, filename='twitter_job_data', format='csv'):
+        """Save the merged tweets from every worker"""
+        if not self.tweets_data:
+            print("No data to save!")
+            return None
+        
+        format = format.lower()
+        return save_tweets(self.tweets_data, f'{filename}.{format}', format)
 
 def main():
     """Main function to run the Twitter scraper with CSV export only"""
@@ -435,7 +674,7 @@ def main():
     job_hashtags = ["naukri", "jobs", "jobseeker", "vacancy"]
     
     # Initialize scraper
-    scraper = TwitterScraper(headless=False)  # Set to True for headless mode
+    scraper = TwitterScraper(headless=False, user_data_dir=_PROFILE_DIR)  # Set to True for headless mode
     
     try:
         print("🚀 Starting Twitter Job Data Scraper...")